@@ -3,8 +3,15 @@ Feedback processing for Wordle game.
 """
 
 from enum import Enum
-from typing import List, Tuple
+from typing import List, Sequence, Tuple
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+import numpy as np
+
+WORD_LENGTH = 5
+NUM_PATTERNS = 3**WORD_LENGTH  # Distinct feedback patterns for a 5-letter word
+_PATTERN_WEIGHTS = 3 ** np.arange(WORD_LENGTH)
 
 
 class LetterStatus(Enum):
@@ -76,6 +83,10 @@ class Feedback:
         """Convert feedback to numeric values."""
         return [status.value for status in self.feedback]
 
+    def to_pattern_id(self) -> int:
+        """Encode feedback as a base-3 integer (position i weighted by 3**i)."""
+        return sum(status.value * 3**i for i, status in enumerate(self.feedback))
+
     def is_correct(self) -> bool:
         """Check if the guess is completely correct."""
         return all(status == LetterStatus.CORRECT for status in self.feedback)
@@ -103,3 +114,121 @@ class Feedback:
             for i, status in enumerate(self.feedback)
             if status == LetterStatus.ABSENT
         }
+
+
+def encode_words(words: Sequence[str]) -> np.ndarray:
+    """
+    Encode lowercase 5-letter words as letter indices.
+
+    Args:
+        words: Words to encode
+
+    Returns:
+        (N, 5) uint8 array with 'a' == 0
+    """
+    if len(words) == 0:
+        return np.empty((0, WORD_LENGTH), dtype=np.uint8)
+    buffer = np.frombuffer("".join(words).encode("ascii"), dtype=np.uint8)
+    return buffer.reshape(len(words), WORD_LENGTH) - np.uint8(ord("a"))
+
+
+def pattern_table(
+    guesses: np.ndarray,
+    answers: np.ndarray,
+    chunk_size: int = 256,
+    max_workers: int = 1,
+) -> np.ndarray:
+    """
+    Compute feedback pattern ids for every (guess, answer) pair.
+
+    Applies the same two-pass rules as Feedback, vectorized over both
+    guesses and answers. Guesses are processed in chunks to bound memory;
+    chunks are independent, so they can be spread over threads (numpy
+    releases the GIL for the array work).
+
+    Args:
+        guesses: Encoded guesses from encode_words()
+        answers: Encoded answers from encode_words()
+        chunk_size: Number of guesses processed per vectorized step
+        max_workers: Number of threads filling chunks
+
+    Returns:
+        (len(guesses), len(answers)) uint8 array of pattern ids
+        (see Feedback.to_pattern_id)
+    """
+    table = np.empty((len(guesses), len(answers)), dtype=np.uint8)
+    starts = range(0, len(guesses), chunk_size)
+
+    def fill(start: int) -> None:
+        g = guesses[start : start + chunk_size, None, :]
+
+        # First pass: correct positions (green)
+        greens = g == answers
+        statuses = greens.astype(np.uint8) * LetterStatus.CORRECT.value
+
+        # Second pass: present letters (yellow), consuming unmatched answer letters
+        unused = np.where(greens, np.uint8(255), answers)
+        for i in range(WORD_LENGTH):
+            matches = unused == g[:, :, i, None]
+            gi, ai = np.nonzero(matches.any(axis=2) & ~greens[:, :, i])
+            unused[gi, ai, matches[gi, ai].argmax(axis=1)] = 255
+            statuses[gi, ai, i] = LetterStatus.PRESENT.value
+
+        table[start : start + len(g)] = statuses @ _PATTERN_WEIGHTS
+
+    if max_workers > 1 and len(starts) > 1:
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            list(executor.map(fill, starts))
+    else:
+        for start in starts:
+            fill(start)
+
+    return table
+
+
+@lru_cache(maxsize=65536)
+def pattern_id(guess: str, answer: str) -> int:
+    """
+    Compute the feedback pattern id of a single guess against an answer.
+
+    Args:
+        guess: The guessed word
+        answer: The target word
+
+    Returns:
+        Pattern id (see Feedback.to_pattern_id)
+    """
+    statuses = [0] * len(guess)
+    unmatched = [0] * 26
+
+    # First pass: greens, counting target letters left for yellows
+    for i, (g_char, t_char) in enumerate(zip(guess, answer)):
+        if g_char == t_char:
+            statuses[i] = 2
+        else:
+            unmatched[ord(t_char) - 97] += 1
+
+    # Second pass: yellows, left to right, while unmatched copies remain
+    pid = 0
+    for i, g_char in enumerate(guess):
+        if statuses[i] == 0:
+            letter = ord(g_char) - 97
+            if unmatched[letter]:
+                statuses[i] = 1
+                unmatched[letter] -= 1
+        pid += statuses[i] * 3**i
+    return pid
+
+
+def pattern_ids(guess: str, answers: np.ndarray) -> np.ndarray:
+    """
+    Compute feedback pattern ids of a guess against many answers at once.
+
+    Args:
+        guess: The guessed word
+        answers: Encoded answers from encode_words()
+
+    Returns:
+        uint8 array of pattern ids (see Feedback.to_pattern_id)
+    """
+    return pattern_table(encode_words([guess.lower()]), answers)[0]
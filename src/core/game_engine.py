@@ -23,8 +23,17 @@ class GameState:
             target_word: The word to guess
             max_attempts: Maximum number of attempts allowed
         """
-        self.target_word = target_word.lower()
         self.max_attempts = max_attempts
+        self.reset(target_word)
+
+    def reset(self, target_word: str) -> None:
+        """
+        Reset state in place for a new target word.
+
+        Args:
+            target_word: The word to guess
+        """
+        self.target_word = target_word.lower()
         self.attempts = 0
         self.guesses: List[str] = []
         self.feedbacks: List[Feedback] = []
@@ -90,7 +99,10 @@ class WordleGame:
         if target_word is None:
             target_word = random.choice(self.word_list.get_common_words())
 
-        self.current_game = GameState(target_word, self.max_attempts)
+        if self.current_game is None:
+            self.current_game = GameState(target_word, self.max_attempts)
+        else:
+            self.current_game.reset(target_word)
         logger.info(f"New game started with word: {target_word}")
         return self.current_game
 
@@ -121,6 +133,11 @@ class WordleGame:
 
         return True, feedback, ""
 
+    def _testing_exhaust(self) -> None:
+        """Mark the current game as lost without playing it out (test helper)."""
+        self.current_game.attempts = self.max_attempts
+        self.current_game.is_over = True
+
     def get_game_state(self) -> Optional[GameState]:
         """Get current game state."""
         return self.current_game
@@ -2,9 +2,13 @@
 Word list management for Wordle solver.
 """
 
+import hashlib
 import os
-from typing import List, Set
+import sys
+from typing import Dict, Optional, Set, Tuple
 import logging
+import numpy as np
+from core.feedback import encode_words, pattern_table
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +33,14 @@ class WordList:
         logger.info(
             f"Loaded {len(self.valid_words)} valid words and {len(self.common_words)} common words"
         )
+        # Derived data, computed on first use; the word sets never change
+        self._sorted_valid: Optional[Tuple[str, ...]] = None
+        self._sorted_common: Optional[Tuple[str, ...]] = None
+        self._letter_frequencies: Optional[Dict[str, int]] = None
+        self._position_counts: Optional[np.ndarray] = None
+        self._uniform_prior: Optional[Dict[str, float]] = None
+        self._word_index: Optional[Dict[str, int]] = None
+        self._pattern_table: Optional[np.ndarray] = None
 
     def _load_words(self, filepath: str) -> Set[str]:
         """Load words from file."""
@@ -36,8 +48,12 @@ class WordList:
             logger.warning(f"Word file not found: {filepath}")
             return self._get_default_words()
 
+        # Interned so the same word shared between both lists and every
+        # solver compares by identity in set and dict lookups
         with open(filepath, "r") as f:
-            words = {line.strip().lower() for line in f if len(line.strip()) == 5}
+            words = {
+                sys.intern(line.strip().lower()) for line in f if len(line.strip()) == 5
+            }
         return words
 
     def _get_default_words(self) -> Set[str]:
@@ -78,14 +94,125 @@ class WordList:
         """Check if word is valid."""
         return word.lower() in self.valid_words
 
-    def get_valid_words(self) -> List[str]:
-        """Get all valid words as a list."""
-        return sorted(list(self.valid_words))
+    def get_valid_words(self) -> Tuple[str, ...]:
+        """Get all valid words, sorted (a shared tuple; copy it to modify)."""
+        if self._sorted_valid is None:
+            self._sorted_valid = tuple(sorted(self.valid_words))
+        return self._sorted_valid
 
-    def get_common_words(self) -> List[str]:
-        """Get common answer words as a list."""
-        return sorted(list(self.common_words))
+    def get_common_words(self) -> Tuple[str, ...]:
+        """Get common answer words, sorted (a shared tuple; copy it to modify)."""
+        if self._sorted_common is None:
+            self._sorted_common = tuple(sorted(self.common_words))
+        return self._sorted_common
 
     def filter_words(self, words: Set[str]) -> Set[str]:
         """Filter to only valid words."""
         return words & self.valid_words
+
+    def _compute_letter_statistics(self) -> None:
+        """Fill the letter and position frequency caches in one pass."""
+        codes = encode_words(self.get_common_words())
+        self._position_counts = np.stack(
+            [np.bincount(codes[:, i], minlength=26) for i in range(codes.shape[1])]
+        )
+
+        # Letter-presence bits count a repeated letter once per word
+        bits = np.bitwise_or.reduce(
+            np.left_shift(np.uint32(1), codes, dtype=np.uint32), axis=1
+        )
+        counts = ((bits[:, None] >> np.arange(26, dtype=np.uint32)) & 1).sum(axis=0)
+        self._letter_frequencies = {
+            chr(ord("a") + c): int(counts[c]) for c in np.flatnonzero(counts)
+        }
+
+    def get_letter_frequencies(self) -> Dict[str, int]:
+        """Number of common words containing each letter."""
+        if self._letter_frequencies is None:
+            self._compute_letter_statistics()
+        return self._letter_frequencies
+
+    def get_position_counts(self) -> np.ndarray:
+        """
+        Count letters at each position across the common words.
+
+        Returns:
+            int array of shape (5, 26) where [i, c] counts letter c at position i
+        """
+        if self._position_counts is None:
+            self._compute_letter_statistics()
+        return self._position_counts
+
+    def get_uniform_prior(self) -> Dict[str, float]:
+        """Equal probability for every common word."""
+        if self._uniform_prior is None:
+            prob = 1.0 / len(self.common_words)
+            self._uniform_prior = {word: prob for word in self.get_common_words()}
+        return self._uniform_prior
+
+    def get_word_index(self) -> Dict[str, int]:
+        """Map each common word to its row/column in the pattern table."""
+        if self._word_index is None:
+            self._word_index = {
+                word: i for i, word in enumerate(self.get_common_words())
+            }
+        return self._word_index
+
+    def get_pattern_table(self) -> np.ndarray:
+        """
+        Get feedback pattern ids for every pair of common words.
+
+        Computed on first use and kept for the lifetime of the word list.
+
+        Returns:
+            uint8 array where [i, j] is the pattern of guess i against answer j
+        """
+        if self._pattern_table is None:
+            encoded = encode_words(self.get_common_words())
+            self._pattern_table = pattern_table(
+                encoded, encoded, max_workers=os.cpu_count() or 1
+            )
+            logger.info(f"Computed {self._pattern_table.shape} pattern table")
+        return self._pattern_table
+
+    def load_pattern_table(self, cache_dir: str) -> np.ndarray:
+        """
+        Get the pattern table, memory-mapped from a file cache when possible.
+
+        The cache file name carries a hash of the common words, so a changed
+        word list never reads a stale table. The table is computed and saved
+        on a cache miss; failing to write the cache only logs a warning.
+
+        Args:
+            cache_dir: Directory holding cached pattern tables
+
+        Returns:
+            Same array as get_pattern_table(), read-only if loaded from disk
+        """
+        if self._pattern_table is not None:
+            return self._pattern_table
+
+        digest = hashlib.sha1(
+            "\n".join(self.get_common_words()).encode()
+        ).hexdigest()[:12]
+        path = os.path.join(cache_dir, f"patterns_{digest}.npy")
+
+        if os.path.exists(path):
+            try:
+                self._pattern_table = np.load(path, mmap_mode="r")
+                logger.info(f"Loaded {self._pattern_table.shape} pattern table from {path}")
+                return self._pattern_table
+            except (OSError, ValueError):
+                logger.warning(f"Ignoring unreadable pattern table cache {path}")
+
+        table = self.get_pattern_table()
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            # Write then rename so a concurrent reader never sees a partial file
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "wb") as f:
+                np.save(f, table)
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.warning(f"Could not write pattern table cache to {cache_dir}")
+        return table
@@ -3,10 +3,11 @@ Abstract base class for all Wordle solvers.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Optional, Dict, Any
-from core.feedback import Feedback
+from typing import List, Optional, Dict, Any, Iterable, FrozenSet, Sequence
+from core.feedback import Feedback, LetterStatus, encode_words, pattern_id, pattern_ids
 from core.word_list import WordList
 import logging
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -24,10 +25,11 @@ class BaseSolver(ABC):
         """
         self.word_list = word_list
         self.config = config or {}
-        self.possible_words = set(word_list.get_common_words())
+        self._set_word_universe(self._initial_words())
         self.guess_history: List[str] = []
         self.feedback_history: List[Feedback] = []
         self.candidates: List[Dict[str, Any]] = []  # Top candidates with scores
+        self.top_k = max(1, int(self.config.get("top_k", 5)))  # size of candidates
         self.selection_info: Dict[str, Any] = {}  # Additional selection info
 
     @abstractmethod
@@ -51,9 +53,99 @@ class BaseSolver(ABC):
         """
         pass
 
+    @property
+    def possible_words(self) -> FrozenSet[str]:
+        """Words still consistent with all feedback received so far."""
+        if self._possible is None:
+            self._possible = frozenset(self.possible_list)
+        return self._possible
+
+    @property
+    def possible_list(self) -> List[str]:
+        """Possible words in sorted order, for iteration and indexing."""
+        if self._possible_list is None:
+            self._possible_list = self._words[self._alive].tolist()
+        return self._possible_list
+
+    @property
+    def num_possible(self) -> int:
+        """Number of possible words, counted from the mask without building a set."""
+        return int(np.count_nonzero(self._alive))
+
+    @possible_words.setter
+    def possible_words(self, words: Iterable[str]) -> None:
+        words = set(words)
+        if words <= self._index.keys():
+            # Subset of the current universe: only the mask changes
+            self._alive[:] = False
+            self._alive[[self._index[word] for word in words]] = True
+            self._possible = frozenset(words)
+            self._possible_list = None
+        else:
+            self._set_word_universe(words)
+
+    def _initial_words(self) -> Sequence[str]:
+        """Words that are possible before any feedback."""
+        return self.word_list.get_common_words()
+
+    def _set_word_universe(self, words: Iterable[str]) -> None:
+        """
+        Replace the word array backing possible_words, all words alive.
+
+        Args:
+            words: Words to track
+        """
+        self._words = np.array(sorted(words), dtype=object)
+        self._index = {word: i for i, word in enumerate(self._words)}
+        self._codes = encode_words(self._words)
+        # Bit k of a word's entry is set iff letter k occurs in it
+        self._letter_bits = np.bitwise_or.reduce(
+            np.left_shift(np.uint32(1), self._codes, dtype=np.uint32), axis=1
+        )
+        self._alive = np.ones(len(self._words), dtype=bool)
+        self._possible = None
+        self._possible_list = None
+
+    def _set_alive(self, alive: np.ndarray) -> None:
+        """
+        Replace the mask of possible words within the current word array.
+
+        Args:
+            alive: Boolean mask aligned with the word array
+        """
+        self._alive = alive
+        self._possible = None
+        self._possible_list = None
+
+    @staticmethod
+    def _top_indices(scores: np.ndarray, k: int = 5) -> np.ndarray:
+        """
+        Positions of the k highest scores, best first.
+
+        Ties keep their original order, as with a stable sort, but only the
+        scores at or above the k-th best are sorted.
+
+        Args:
+            scores: 1-D array of scores
+            k: Number of positions to return
+
+        Returns:
+            Up to k indices into scores
+        """
+        if len(scores) > k:
+            threshold = np.partition(scores, len(scores) - k)[len(scores) - k]
+            idx = np.flatnonzero(scores >= threshold)
+        else:
+            idx = np.arange(len(scores))
+        return idx[np.argsort(-scores[idx], kind="stable")[:k]]
+
     def reset(self) -> None:
         """Reset solver to initial state."""
-        self.possible_words = set(self.word_list.get_common_words())
+        initial_words = self._initial_words()
+        if self._index.keys() == set(initial_words):
+            self._set_alive(np.ones(len(self._words), dtype=bool))
+        else:
+            self._set_word_universe(initial_words)
         self.guess_history = []
         self.feedback_history = []
         self.candidates = []
@@ -64,7 +156,7 @@ class BaseSolver(ABC):
         """Get solver statistics."""
         return {
             "guesses_made": len(self.guess_history),
-            "remaining_words": len(self.possible_words),
+            "remaining_words": self.num_possible,
             "algorithm": self.__class__.__name__,
             "candidates": self.candidates,
             "selection_info": self.selection_info,
@@ -78,14 +170,61 @@ class BaseSolver(ABC):
             guess: The guessed word
             feedback: Feedback received
         """
-        new_possible_words = set()
+        # Only rows still alive are compared; dead rows stay dead
+        alive_idx = np.flatnonzero(self._alive)
+        keep = pattern_ids(guess, self._codes[alive_idx]) == feedback.to_pattern_id()
+        self._alive[alive_idx[~keep]] = False
+        self._set_alive(self._alive)
+        logger.debug(f"Filtered to {self.num_possible} possible words")
+
+    def _local_filter(self, guess: str, feedback: Feedback) -> None:
+        """
+        Conservative letter-by-letter filter, used when exact filtering fails.
 
-        for word in self.possible_words:
-            if self._word_matches_feedback(word, guess, feedback):
-                new_possible_words.add(word)
+        Removes words that contradict a CORRECT letter, contain an ABSENT
+        letter anywhere, or lack a PRESENT letter (or have it at the guessed
+        position). Keeps the current words if nothing would survive.
 
-        self.possible_words = new_possible_words
-        logger.debug(f"Filtered to {len(self.possible_words)} possible words")
+        Args:
+            guess: The guessed word
+            feedback: Feedback received
+        """
+        statuses = getattr(feedback, "feedback", None)
+        if not guess or statuses is None:
+            logger.debug("Missing guess or feedback statuses; skipping local filter")
+            return
+
+        # Narrow a copy of the alive mask; letter membership reads one bit
+        # of each word's letter-presence set
+        keep = self._alive.copy()
+        for i, status in enumerate(statuses):
+            letter = ord(guess[i]) - ord("a")
+            has_letter = ((self._letter_bits >> np.uint32(letter)) & 1).astype(bool)
+            if status == LetterStatus.CORRECT:
+                keep &= self._codes[:, i] == letter
+            elif status == LetterStatus.ABSENT:
+                keep &= ~has_letter
+            elif status == LetterStatus.PRESENT:
+                keep &= has_letter & (self._codes[:, i] != letter)
+
+        if keep.any():
+            self._set_alive(keep)
+        else:
+            logger.debug("Local filter would remove all words; keeping previous words")
+
+    def _apply_feedback(self, guess: str, feedback: Feedback) -> None:
+        """
+        Narrow possible words by feedback, falling back to the local filter.
+
+        Args:
+            guess: The guessed word
+            feedback: Feedback received
+        """
+        try:
+            self._filter_words_by_feedback(guess, feedback)
+        except Exception:
+            logger.exception("Exact feedback filtering failed; using local filter")
+            self._local_filter(guess, feedback)
 
     def _word_matches_feedback(self, word: str, guess: str, feedback: Feedback) -> bool:
         """
@@ -99,10 +238,5 @@ class BaseSolver(ABC):
         Returns:
             True if word is consistent with feedback
         """
-        from core.feedback import LetterStatus, Feedback as FeedbackClass
-
-        # Generate what the feedback would be for this word
-        test_feedback = FeedbackClass(guess, word)
-
-        # Check if feedbacks match
-        return test_feedback.feedback == feedback.feedback
+        # Compare the pattern this word would produce with the observed one
+        return pattern_id(guess, word) == feedback.to_pattern_id()
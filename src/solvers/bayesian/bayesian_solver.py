@@ -2,28 +2,81 @@
 Bayesian/Probabilistic solver using information theory.
 """
 
-from typing import List, Dict, Set
+from typing import List, Dict, Optional, Set
 from solvers.base_solver import BaseSolver
-from core.feedback import Feedback, LetterStatus
+from core.feedback import Feedback, LetterStatus, NUM_PATTERNS, encode_words, pattern_table
 from core.word_list import WordList
-import math
 from collections import Counter
+import numpy as np
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+def _entropy_from_patterns(patterns: np.ndarray, probs: np.ndarray) -> np.ndarray:
+    """
+    Expected information gain (bits) of each guess.
+
+    Args:
+        patterns: (guesses, answers) array of feedback pattern ids
+        probs: Probability weight of each answer
+
+    Returns:
+        Array with the entropy of each guess's feedback pattern distribution
+    """
+    n_guesses = len(patterns)
+
+    # Probability mass of each (guess, pattern) pair in one bincount. With a
+    # uniform prior the plain pattern counts give the same distribution.
+    bins = patterns + np.arange(n_guesses)[:, None] * NUM_PATTERNS
+    uniform = probs.size > 0 and probs.min() == probs.max() > 0
+    mass = np.bincount(
+        bins.ravel(),
+        weights=None if uniform else np.tile(probs, n_guesses),
+        minlength=n_guesses * NUM_PATTERNS,
+    ).reshape(n_guesses, NUM_PATTERNS).astype(np.float64)
+
+    total = mass.sum(axis=1, keepdims=True)
+    p = np.divide(mass, total, out=np.zeros_like(mass), where=total > 0)
+    plogp = p * np.log2(p, out=np.zeros_like(p), where=p > 0)
+    return -plogp.sum(axis=1)
+
+
 class BayesianSolver(BaseSolver):
     """Wordle solver using Bayesian probability and information gain."""
 
+    # Pre-computed optimal starting words based on information theory
+    OPTIMAL_STARTERS = ("soare", "roate", "raise", "slate", "crane")
+
     def __init__(self, word_list: WordList, config: dict = None):
         super().__init__(word_list, config)
-        self.word_probabilities = self._initialize_probabilities()
+        # Materialized lazily: the first guess does not need probabilities
+        self._word_probabilities: Optional[Dict[str, float]] = None
         self.entropy_threshold = config.get("entropy_threshold", 0.5) if config else 0.5
+        self.use_pattern_table = config.get("use_pattern_table", True) if config else True
+        self.answer_sample_size = int(config.get("answer_sample_size", 512)) if config else 512
+        self.sample_threshold = int(config.get("sample_threshold", 1000)) if config else 1000
+        self.refine_top_k = int(config.get("refine_top_k", 5)) if config else 5
+        self.block_size = int(config.get("block_size", 5)) if config else 5
+        self._answers = None  # Possible words and weights, see _answer_matrix
+
+    @property
+    def word_probabilities(self) -> Dict[str, float]:
+        """Probability of each possible word being the answer."""
+        if self._word_probabilities is None:
+            self._word_probabilities = self._initialize_probabilities()
+        return self._word_probabilities
+
+    @word_probabilities.setter
+    def word_probabilities(self, probabilities: Dict[str, float]) -> None:
+        self._word_probabilities = probabilities
 
     def _initialize_probabilities(self) -> Dict[str, float]:
         """Initialize uniform probabilities for all words."""
-        words = list(self.possible_words)
+        words = self.possible_list
+        if len(words) == len(self.word_list.common_words):
+            # Still the full common list: copy the shared prior
+            return dict(self.word_list.get_uniform_prior())
         prob = 1.0 / len(words)
         return {word: prob for word in words}
 
@@ -32,10 +85,10 @@ class BayesianSolver(BaseSolver):
         if not self.guess_history:
             return self._get_first_guess()
 
-        if len(self.possible_words) == 1:
-            return list(self.possible_words)[0]
+        if self.num_possible == 1:
+            return self.possible_list[0]
 
-        if len(self.possible_words) <= 2:
+        if self.num_possible <= 2:
             # Just guess from remaining words
             return max(self.word_probabilities.items(), key=lambda x: x[1])[0]
 
@@ -45,43 +98,59 @@ class BayesianSolver(BaseSolver):
 
     def _get_first_guess(self) -> str:
         """Get optimal first guess."""
-        # Pre-computed optimal starting words based on information theory
-        optimal_starters = ["soare", "roate", "raise", "slate", "crane"]
-
-        for word in optimal_starters:
+        for word in self.OPTIMAL_STARTERS:
             if word in self.possible_words:
                 return word
 
-        return list(self.possible_words)[0]
+        return self.possible_list[0]
 
     def _maximize_information_gain(self) -> str:
         """Find word that maximizes expected information gain."""
         # For performance, sample if too many words
-        candidate_guesses = list(self.possible_words)
+        answers, weights = self._answer_matrix()
+        candidate_guesses = answers
         if len(candidate_guesses) > 20:
-            # Sample most probable words plus some exploration
-            sorted_words = sorted(
-                self.word_probabilities.items(), key=lambda x: x[1], reverse=True
+            # Sample most probable words plus some exploration: ties are
+            # broken by a fixed shuffle rather than alphabetical order
+            order = np.random.default_rng(0).permutation(len(answers))
+            top = order[np.argsort(-weights[order], kind="stable")[:20]]
+            candidate_guesses = [answers[i] for i in top]
+
+        sample_size = min(self.answer_sample_size, len(answers))
+        sampled = len(answers) > self.sample_threshold
+        if sampled:
+            # Estimate on a fixed random subset of answers, then score only
+            # the most promising candidates against the full set
+            sample = np.random.default_rng(0).choice(
+                len(answers), sample_size, replace=False
             )
-            candidate_guesses = [w for w, _ in sorted_words[:20]]
-
-        best_guess = None
-        best_score = -float("inf")
-        scores = {}
-
-        for guess in candidate_guesses:
-            expected_info = self._calculate_expected_information(guess)
-            scores[guess] = expected_info
+            estimate = _entropy_from_patterns(
+                self._patterns_for(candidate_guesses, sample), weights[sample]
+            )
+            top = np.argsort(-estimate, kind="stable")[: self.refine_top_k]
+            candidate_guesses = [candidate_guesses[i] for i in top]
+
+        # Score in blocks, most probable first, and stop once a guess reaches
+        # the entropy ceiling: no later candidate can beat it
+        max_info = np.log2(min(len(answers), NUM_PATTERNS)) - 1e-6
+        expected_info = np.empty(0)
+        for start in range(0, len(candidate_guesses), self.block_size):
+            block = candidate_guesses[start : start + self.block_size]
+            expected_info = np.concatenate(
+                [expected_info, _entropy_from_patterns(self._patterns_for(block), weights)]
+            )
+            if expected_info.max() >= max_info:
+                break
+        candidate_guesses = candidate_guesses[: len(expected_info)]
 
-            if expected_info > best_score:
-                best_score = expected_info
-                best_guess = guess
+        scores = dict(zip(candidate_guesses, expected_info.tolist()))
+        best_guess = candidate_guesses[int(expected_info.argmax())]
 
         # Update candidates for UI
         sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
         self.candidates = [
             {"word": word, "score": f"{score:.4f}"}
-            for word, score in sorted_scores[:5]
+            for word, score in sorted_scores[: self.top_k]
         ]
         
         entropy = self._calculate_entropy()
@@ -89,59 +158,67 @@ class BayesianSolver(BaseSolver):
             "method": "Bayesian Information Theory",
             "entropy": f"{entropy:.2f}",
             "candidates_evaluated": len(scores),
-            "total_remaining": len(self.possible_words),
+            "total_remaining": self.num_possible,
+            "answers_sampled": sample_size if sampled else len(answers),
         }
 
         return best_guess
 
+    def _answer_matrix(self):
+        """Get possible words and their probabilities (cached until next update)."""
+        if self._answers is None:
+            words = self.possible_list
+            weights = np.array([self.word_probabilities.get(w, 0) for w in words])
+            self._answers = (words, weights)
+        return self._answers
+
+    def _patterns_for(
+        self, guesses: List[str], answer_idx: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Get feedback pattern ids of each guess against the possible words.
+
+        Args:
+            guesses: Candidate guesses
+            answer_idx: Positions in _answer_matrix() to use (None for all)
+        """
+        answers, _ = self._answer_matrix()
+        if answer_idx is not None:
+            answers = [answers[i] for i in answer_idx]
+        return self._patterns_against(guesses, answers)
+
+    def _patterns_against(self, guesses: List[str], answers: List[str]) -> np.ndarray:
+        """Get feedback pattern ids of each guess against each answer."""
+        if self.use_pattern_table:
+            # Slice the word list's shared table instead of recomputing
+            index = self.word_list.get_word_index()
+            if all(g in index for g in guesses):
+                rows = [index[g] for g in guesses]
+                cols = [index[a] for a in answers]
+                return self.word_list.get_pattern_table()[np.ix_(rows, cols)]
+
+        return pattern_table(encode_words(guesses), encode_words(answers))
+
     def _calculate_expected_information(self, guess: str) -> float:
         """Calculate expected information gain for a guess."""
-        # from ...core.feedback import Feedback as FeedbackClass
-
-        # Group possible answers by their feedback pattern
-        pattern_groups: Dict[tuple, List[str]] = {}
-
-        for answer in self.possible_words:
-            feedback = Feedback(guess, answer)
-            pattern = tuple(feedback.to_numeric())
-
-            if pattern not in pattern_groups:
-                pattern_groups[pattern] = []
-            pattern_groups[pattern].append(answer)
-
-        # Calculate entropy
-        total_prob = sum(self.word_probabilities.get(w, 0) for w in self.possible_words)
-        expected_info = 0.0
-
-        for pattern, words in pattern_groups.items():
-            # Probability of this pattern
-            pattern_prob = (
-                sum(self.word_probabilities.get(w, 0) for w in words) / total_prob
-            )
-
-            if pattern_prob > 0:
-                # Information gained from this pattern
-                info = -math.log2(pattern_prob)
-                expected_info += pattern_prob * info
-
-        return expected_info
+        _, weights = self._answer_matrix()
+        return float(_entropy_from_patterns(self._patterns_for([guess]), weights)[0])
 
     def _calculate_entropy(self) -> float:
         """Calculate current entropy of word distribution."""
-        entropy = 0.0
-        total_prob = sum(self.word_probabilities.values())
+        probs = np.fromiter(self.word_probabilities.values(), dtype=np.float64)
+        probs = probs[probs > 0]
+        if probs.size == 0:
+            return 0.0
 
-        for prob in self.word_probabilities.values():
-            if prob > 0:
-                normalized_prob = prob / total_prob
-                entropy -= normalized_prob * math.log2(normalized_prob)
-
-        return entropy
+        probs /= probs.sum()
+        return float(-np.sum(probs * np.log2(probs)))
 
     def update_state(self, guess: str, feedback: Feedback) -> None:
         """Update probabilities based on Bayesian inference."""
         self.guess_history.append(guess)
         self.feedback_history.append(feedback)
+        self._answers = None
 
         # Filter words and update probabilities
         self._bayesian_update(guess, feedback)
@@ -149,25 +226,26 @@ class BayesianSolver(BaseSolver):
         # Normalize probabilities
         self._normalize_probabilities()
 
-        entropy = self._calculate_entropy()
-        logger.info(
-            f"Bayesian: {len(self.possible_words)} words remaining. "
-            f"Entropy: {entropy:.2f}"
-        )
+        # Entropy is only reported, so skip it when nobody is listening
+        if logger.isEnabledFor(logging.INFO):
+            entropy = self._calculate_entropy()
+            logger.info(
+                f"Bayesian: {self.num_possible} words remaining. "
+                f"Entropy: {entropy:.2f}"
+            )
 
     def _bayesian_update(self, guess: str, feedback: Feedback) -> None:
         """Update probabilities using Bayes' rule."""
-        # from ...core.feedback import Feedback as FeedbackClass
-
-        # Keep only words consistent with feedback
-        new_probabilities = {}
-
-        for word in self.possible_words:
-            # Check if word is consistent with feedback
-            test_feedback = Feedback(guess, word)
-
-            if test_feedback.feedback == feedback.feedback:
-                new_probabilities[word] = self.word_probabilities.get(word, 1.0)
+        # Keep only words whose pattern against the guess matches the feedback
+        words = self.possible_list
+        keep = self._patterns_against([guess], words)[0] == feedback.to_pattern_id()
+
+        # Before the first update the prior is uniform, so survivors start
+        # with equal weight
+        prior = self._word_probabilities or {}
+        new_probabilities = {
+            word: prior.get(word, 1.0) for word, matches in zip(words, keep) if matches
+        }
 
         self.word_probabilities = new_probabilities
         self.possible_words = set(new_probabilities.keys())
@@ -183,4 +261,5 @@ class BayesianSolver(BaseSolver):
     def reset(self) -> None:
         """Reset solver state."""
         super().reset()
-        self.word_probabilities = self._initialize_probabilities()
+        self._word_probabilities = None
+        self._answers = None
@@ -2,10 +2,31 @@
 Constraint definitions for CSP solver.
 """
 
-from typing import Set, List, Dict
+from typing import Iterable, Set, List, Dict, Optional
+import re
+from functools import lru_cache
 from core.feedback import Feedback, LetterStatus
 
 
+def letter_bit(letter: str) -> int:
+    """Bit for a lowercase letter in a 26-bit letter set."""
+    return 1 << (ord(letter) - ord("a"))
+
+
+def mask_letters(mask: int) -> str:
+    """Letters contained in a 26-bit letter set, in alphabetical order."""
+    return "".join(chr(ord("a") + i) for i in range(26) if mask >> i & 1)
+
+
+@lru_cache(maxsize=None)
+def letter_mask(word: str) -> int:
+    """26-bit set of the letters in a word."""
+    mask = 0
+    for letter in word:
+        mask |= letter_bit(letter)
+    return mask
+
+
 class Constraint:
     """Base class for constraints."""
 
@@ -13,6 +34,10 @@ class Constraint:
         """Check if word satisfies constraint."""
         raise NotImplementedError
 
+    def key(self) -> tuple:
+        """Identity of the constraint; equal keys are redundant."""
+        return (type(self), tuple(sorted(vars(self).items())))
+
 
 class PositionConstraint(Constraint):
     """Constraint for letter at specific position."""
@@ -57,18 +82,103 @@ class ExcludeLetterConstraint(Constraint):
 
 
 class ConstraintSet:
-    """Collection of constraints."""
+    """Collection of constraints.
+
+    Letter and position constraints are folded into letter bitmasks so a
+    word is checked with a few integer operations instead of one call per
+    constraint. Other constraint types are checked individually.
+    """
 
     def __init__(self):
         self.constraints: List[Constraint] = []
+        self._keys: Set[tuple] = set()  # keys of constraints already added
+        self.required_mask = 0  # letters the word must contain
+        self.forbidden_mask = 0  # letters the word must not contain
+        self.pos_required: Dict[int, str] = {}  # position -> letter
+        self.pos_forbidden: Dict[int, int] = {}  # position -> forbidden letter mask
+        self._other: List[Constraint] = []
+        self._compiled: Optional[re.Pattern] = None
 
     def add_constraint(self, constraint: Constraint):
-        """Add a constraint."""
+        """Add a constraint, ignoring ones already in the set."""
+        key = constraint.key()
+        if key in self._keys:
+            return
+        self._keys.add(key)
         self.constraints.append(constraint)
-
-    def is_satisfied(self, word: str) -> bool:
-        """Check if word satisfies all constraints."""
-        return all(c.is_satisfied(word) for c in self.constraints)
+        self._compiled = None
+
+        if isinstance(constraint, PositionConstraint):
+            self.pos_required[constraint.position] = constraint.letter
+        elif isinstance(constraint, ExcludePositionConstraint):
+            self.pos_forbidden[constraint.position] = self.pos_forbidden.get(
+                constraint.position, 0
+            ) | letter_bit(constraint.letter)
+        elif isinstance(constraint, ContainsLetterConstraint):
+            self.required_mask |= letter_bit(constraint.letter)
+        elif isinstance(constraint, ExcludeLetterConstraint):
+            self.forbidden_mask |= letter_bit(constraint.letter)
+        else:
+            self._other.append(constraint)
+
+    def constraint_count(self) -> int:
+        """Number of distinct constraints."""
+        return len(self.constraints)
+
+    def is_satisfied(self, word: str, mask: Optional[int] = None) -> bool:
+        """
+        Check if word satisfies all constraints.
+
+        Args:
+            word: Word to check
+            mask: Precomputed letter_mask(word), if available
+        """
+        if mask is None:
+            mask = letter_mask(word)
+
+        if mask & self.forbidden_mask or mask & self.required_mask != self.required_mask:
+            return False
+
+        for pos, letter in self.pos_required.items():
+            if word[pos] != letter:
+                return False
+
+        for pos, forbidden in self.pos_forbidden.items():
+            if letter_bit(word[pos]) & forbidden:
+                return False
+
+        return all(c.is_satisfied(word) for c in self._other)
+
+    def compile_regex(self) -> re.Pattern:
+        """
+        Compile the letter and position constraints into one regex.
+
+        Required letters become lookaheads; every position becomes either
+        its green letter or a class excluding forbidden letters. The
+        pattern is cached until the next constraint is added.
+        """
+        if self._compiled is None:
+            lookaheads = "".join(
+                f"(?=.*{letter})" for letter in mask_letters(self.required_mask)
+            )
+            positions = []
+            for pos in range(5):
+                excluded = self.forbidden_mask | self.pos_forbidden.get(pos, 0)
+                if pos in self.pos_required:
+                    letter = self.pos_required[pos]
+                    positions.append("(?!)" if letter_bit(letter) & excluded else letter)
+                elif excluded:
+                    positions.append(f"[^{mask_letters(excluded)}]")
+                else:
+                    positions.append(".")
+            self._compiled = re.compile(lookaheads + "".join(positions))
+        return self._compiled
+
+    def filter(self, words: Iterable[str]) -> List[str]:
+        """Get the words that satisfy all constraints."""
+        if self._other:
+            return [w for w in words if self.is_satisfied(w)]
+        return list(filter(self.compile_regex().fullmatch, words))
 
     def add_from_feedback(self, guess: str, feedback: Feedback):
         """Add constraints based on feedback."""
@@ -8,7 +8,7 @@ from solvers.csp.constraints import ConstraintSet
 from core.feedback import Feedback
 from core.word_list import WordList
 import logging
-from collections import Counter
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -16,18 +16,32 @@ logger = logging.getLogger(__name__)
 class CSPSolver(BaseSolver):
     """Wordle solver using Constraint Satisfaction Problem approach."""
 
+    # Common starting words with diverse letters
+    STARTING_WORDS = ("slate", "crane", "crate", "stare", "trace")
+
     def __init__(self, word_list: WordList, config: dict = None):
         super().__init__(word_list, config)
         self.constraints = ConstraintSet()
         self.letter_frequencies = self._compute_letter_frequencies()
 
+        self._letter_scores = self._compute_letter_scores()
+
     def _compute_letter_frequencies(self) -> dict:
         """Compute letter frequency across all words."""
-        freq = Counter()
-        for word in self.word_list.get_common_words():
-            for letter in set(word):
-                freq[letter] += 1
-        return dict(freq)
+        return dict(self.word_list.get_letter_frequencies())
+
+    def _compute_letter_scores(self) -> np.ndarray:
+        """Score every candidate word by its unique letters and their frequencies."""
+        # One row per word, one column per letter it contains
+        presence = np.zeros((len(self._words), 26), dtype=np.float32)
+        presence[np.arange(len(self._words))[:, None], self._codes] = 1
+        freq_vec = np.array(
+            [self.letter_frequencies.get(chr(ord("a") + i), 0) for i in range(26)],
+            dtype=np.float32,
+        )
+
+        # Reward unique letters, then common letters
+        return 10 * presence.sum(axis=1) + presence @ freq_vec
 
     def get_next_guess(self) -> str:
         """Get next guess using CSP approach with heuristics."""
@@ -36,9 +50,7 @@ class CSPSolver(BaseSolver):
             return self._get_optimal_first_guess()
 
         # Filter words that satisfy all constraints
-        valid_words = [
-            w for w in self.possible_words if self.constraints.is_satisfied(w)
-        ]
+        valid_words = self.constraints.filter(self.possible_list)
 
         if not valid_words:
             logger.warning("No valid words found, using fallback")
@@ -52,47 +64,32 @@ class CSPSolver(BaseSolver):
 
     def _get_optimal_first_guess(self) -> str:
         """Get optimal first guess."""
-        # Common starting words with diverse letters
-        starting_words = ["slate", "crane", "crate", "stare", "trace"]
-
-        for word in starting_words:
+        for word in self.STARTING_WORDS:
             if word in self.possible_words:
                 return word
 
-        return list(self.possible_words)[0]
+        return self.possible_list[0]
 
     def _select_best_word(self, valid_words: List[str]) -> str:
         """Select best word using heuristics."""
         # Score words based on letter frequency and uniqueness
-        scores = {}
-
-        for word in valid_words:
-            score = 0
-            unique_letters = set(word)
-
-            # Reward unique letters
-            score += len(unique_letters) * 10
-
-            # Reward common letters
-            for letter in unique_letters:
-                score += self.letter_frequencies.get(letter, 0)
-
-            scores[word] = score
+        word_scores = self._letter_scores[[self._index[word] for word in valid_words]]
 
-        # Sort by score
-        sorted_words = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        # Sort by score; only the top few are ever shown
+        order = self._top_indices(word_scores, self.top_k)
+        sorted_words = [(valid_words[i], word_scores[i]) for i in order]
         
         # Update candidates for UI
         self.candidates = [
             {"word": word, "score": f"{score:.0f}"}
-            for word, score in sorted_words[:5]
+            for word, score in sorted_words
         ]
         
         self.selection_info = {
             "method": "CSP with Heuristics",
             "valid_words": len(valid_words),
             "constraints_active": self.constraints.constraint_count() if hasattr(self.constraints, 'constraint_count') else 0,
-            "total_candidates": len(self.possible_words),
+            "total_candidates": self.num_possible,
         }
 
         # Return word with highest score
@@ -101,8 +98,8 @@ class CSPSolver(BaseSolver):
 
     def _get_fallback_guess(self) -> str:
         """Get fallback guess when no valid words found."""
-        if self.possible_words:
-            return list(self.possible_words)[0]
+        if self.num_possible:
+            return self.possible_list[0]
         return "slate"
 
     def update_state(self, guess: str, feedback: Feedback) -> None:
@@ -116,7 +113,7 @@ class CSPSolver(BaseSolver):
         # Filter possible words
         self._filter_words_by_feedback(guess, feedback)
 
-        logger.info(f"CSP: {len(self.possible_words)} words remaining after '{guess}'")
+        logger.info(f"CSP: {self.num_possible} words remaining after '{guess}'")
 
     def reset(self) -> None:
         """Reset solver state."""
@@ -2,12 +2,13 @@
 Genetic Algorithm solver for Wordle (hardened against empty-population failures).
 """
 
-from typing import List, Set, Tuple, Dict, Optional
+from typing import List, Set, Tuple, Dict, Optional, Sequence
 from solvers.base_solver import BaseSolver
-from core.feedback import Feedback, LetterStatus
+from core.feedback import Feedback, encode_words, pattern_id, pattern_ids
 from core.word_list import WordList
-import random
+import heapq
 import logging
+import numpy as np
 from collections import Counter
 
 logger = logging.getLogger(__name__)
@@ -18,6 +19,12 @@ if not logger.handlers:
 class GeneticSolver(BaseSolver):
     """Wordle solver using Genetic Algorithm with defensive checks."""
 
+    # Robust first guesses, most preferred first
+    STARTING_WORDS = ("slate", "crane", "stare", "trace", "raise")
+
+    # Children compared against the feasible pool per broadcast
+    PLACEMENT_BLOCK = 256
+
     def __init__(self, word_list: WordList, config: dict = None):
         super().__init__(word_list, config)
         self.config = config or {}
@@ -26,54 +33,94 @@ class GeneticSolver(BaseSolver):
         self.mutation_rate = float(self.config.get("mutation_rate", 0.01))
         self.crossover_rate = float(self.config.get("crossover_rate", 0.7))
         self.elite_size = int(self.config.get("elite_size", 10))
-
-        # State
-        valid_words = list(self.word_list.get_valid_words() or [])
-        self.possible_words: Set[str] = set(valid_words)
+        # One generator for all draws; a seed makes evolution reproducible
+        self._rng = np.random.default_rng(self.config.get("seed"))
+
+        # Word lists never change; keep immutable copies instead of re-fetching
+        self._commons_tuple, self._valids_tuple = self._load_word_tuples()
+        self._commons_set = frozenset(self._commons_tuple)
+        self._valids_set = frozenset(self._valids_tuple)
+        # Preferred recovery words: commons that are valid, else either list
+        self._recovery_pool = (
+            (self._commons_set & self._valids_set) or self._valids_set or self._commons_set
+        )
+
+        # State (possible_words starts as every valid word, see _initial_words)
         self.population: List[str] = []
         self.generation = 0
+        self._observed_ids: List[Optional[int]] = []  # see _observed_pattern_ids
+        self._feasible = None  # see _feasible_pool
+        self._fitness_cache: Dict[str, float] = {}  # cleared whenever feedback arrives
+        self._scored_population = None  # (population, fitness pairs) from evolution
         self.letter_frequencies = self._compute_frequencies()
 
+        # Same answer every game until the word lists change
+        self._first_guess = self._get_first_guess()
+
+        # Per-letter tables for scoring whole populations at once
+        self._freq_arr = np.array(
+            [self.letter_frequencies.get(chr(ord("a") + c), 0) for c in range(26)]
+        )
+        self._mutation_p = self._freq_arr / self._freq_arr.sum()  # mutation letter odds
+        self._pos_tab = np.array(
+            [[self._position_score(i, chr(ord("a") + c)) for c in range(26)] for i in range(5)]
+        )
+
         # Ensure histories exist (BaseSolver may initialize them)
         self.guess_history = getattr(self, "guess_history", [])
         self.feedback_history = getattr(self, "feedback_history", [])
 
-    def _compute_frequencies(self) -> Dict[str, float]:
-        """Compute letter frequencies from common words (fallback if none)."""
-        freq = Counter()
+    def _initial_words(self) -> Sequence[str]:
+        """Every valid word is a candidate before any feedback."""
+        try:
+            return self.word_list.get_valid_words() or ()
+        except Exception:
+            return ()
+
+    def _load_word_tuples(self) -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+        """Fetch the common and valid word lists once (empty on failure)."""
         try:
-            sources = list(self.word_list.get_common_words() or [])
+            commons = self.word_list.get_common_words() or ()
         except Exception:
-            sources = []
+            commons = ()
+        try:
+            valids = self.word_list.get_valid_words() or ()
+        except Exception:
+            valids = ()
+        return commons, valids
+
+    def _compute_frequencies(self) -> Dict[str, float]:
+        """Compute letter frequencies from common words (fallback if none)."""
+        sources = list(self._commons_tuple)
 
         if not sources:
             # fallback to a small starter list
             sources = ["slate", "crane", "stare", "raise", "arise"]
 
-        for word in sources:
-            for letter in word:
-                freq[letter] += 1
+        # Count over the whole corpus in one pass
+        joined = "".join(sources)
+        freq = Counter(joined)
 
-        total = sum(freq.values()) or 1
+        total = len(joined) or 1
         return {k: v / total for k, v in freq.items()}
 
     def get_next_guess(self) -> str:
         """Get next guess using genetic algorithm with fallbacks."""
         # Ensure we have some possible words
-        if not self.possible_words:
+        if not self.num_possible:
             logger.warning("possible_words empty in GeneticSolver.get_next_guess(); attempting recovery.")
             self._recover_possible_words()
-            if not self.possible_words:
+            if not self.num_possible:
                 fallback = self._fallback_guess()
                 logger.error("Recovery failed; returning fallback guess: %s", fallback)
                 return fallback
 
         # First guess behavior
         if not self.guess_history:
-            return self._get_first_guess()
+            return self._first_guess
 
         # If only one candidate left, return it
-        if len(self.possible_words) == 1:
+        if self.num_possible == 1:
             return next(iter(self.possible_words))
 
         # Initialize population if needed
@@ -100,60 +147,49 @@ class GeneticSolver(BaseSolver):
 
     def _get_first_guess(self) -> str:
         """Choose a robust first guess (prefer common starters)."""
-        starting_words = ["slate", "crane", "stare", "trace", "raise"]
-        for word in starting_words:
-            if word in self.possible_words:
-                return word
-        # fallback to common words or any valid word
-        return self._fallback_guess()
+        return next(
+            (word for word in self.STARTING_WORDS if word in self.possible_words),
+            # fallback to common words or any valid word
+            self._fallback_guess(),
+        )
 
     def _fallback_guess(self) -> str:
         """Safe fallback guess (prefer common words, else any valid)."""
-        try:
-            commons = list(self.word_list.get_common_words() or [])
-        except Exception:
-            commons = []
-        try:
-            valids = list(self.word_list.get_valid_words() or [])
-        except Exception:
-            valids = []
-
-        if commons:
-            return commons[0]
-        if valids:
-            return valids[0]
+        if self._commons_tuple:
+            return self._commons_tuple[0]
+        if self._valids_tuple:
+            return self._valids_tuple[0]
         # final last-resort word
         return "raise"
 
     def _initialize_population(self) -> List[str]:
         """Initialize population with random possible words."""
-        candidates = list(self.possible_words)
+        candidates = list(self.possible_list)
         if not candidates:
             return []
         if len(candidates) <= self.population_size:
             # shuffle to avoid deterministic behavior
-            random.shuffle(candidates)
+            self._rng.shuffle(candidates)
             return candidates.copy()
-        return random.sample(candidates, self.population_size)
+        picks = self._rng.choice(len(candidates), size=self.population_size, replace=False)
+        return [candidates[i] for i in picks]
 
     def _seed_population_from_possible_words(self) -> None:
         """Seed a minimal population when evolution mechanisms fail."""
-        candidates = list(self.possible_words)[: max(1, self.population_size // 4)]
+        candidates = self.possible_list[: max(1, self.population_size // 4)]
         if not candidates:
             # fallback to valid/common words
-            try:
-                candidates = list(self.word_list.get_common_words() or [])[:10]
-            except Exception:
-                candidates = []
-        if not candidates:
-            try:
-                candidates = list(self.word_list.get_valid_words() or [])[:10]
-            except Exception:
-                candidates = []
+            candidates = list(self._commons_tuple[:10]) or list(self._valids_tuple[:10])
         self.population = candidates.copy()
 
-    def _fitness(self, word: str) -> float:
-        """Calculate fitness of a word (higher is better)."""
+    def _fitness(self, word: str, constraint_score: Optional[float] = None) -> float:
+        """
+        Calculate fitness of a word (higher is better).
+
+        Args:
+            word: Word to score
+            constraint_score: Precomputed _constraint_score(word), if available
+        """
         score = 0.0
 
         # Letter frequency score (unique letter set)
@@ -170,7 +206,9 @@ class GeneticSolver(BaseSolver):
 
         # Constraint satisfaction score if we have history
         if self.guess_history:
-            score += self._constraint_score(word) * 50
+            if constraint_score is None:
+                constraint_score = self._constraint_score(word)
+            score += constraint_score * 50
 
         return score
 
@@ -190,21 +228,110 @@ class GeneticSolver(BaseSolver):
         if not self.feedback_history:
             return 1.0
 
-        for guess, feedback in zip(self.guess_history, self.feedback_history):
+        for guess, observed in zip(self.guess_history, self._observed_pattern_ids()):
             try:
-                test_feedback = Feedback(guess, word)
                 # If formats differ, be conservative and reward less strongly rather than reject
-                if getattr(test_feedback, "feedback", None) is None or getattr(feedback, "feedback", None) is None:
+                if observed is None:
                     # unknown formats -> mild penalty
                     return 0.5
-                if test_feedback.feedback != feedback.feedback:
+                if pattern_id(guess, word) != observed:
                     return 0.0
             except Exception:
-                # If Feedback construction fails, don't harshly penalize candidate
+                # If the pattern comparison fails, don't harshly penalize candidate
                 logger.debug("Feedback comparison failed for guess=%s candidate=%s", guess, word)
                 return 0.5
         return 1.0
 
+    @staticmethod
+    def _observed_id(feedback: Feedback) -> Optional[int]:
+        """Pattern id of received feedback, or None for unknown formats."""
+        if getattr(feedback, "feedback", None) is None:
+            return None
+        return feedback.to_pattern_id()
+
+    def _observed_pattern_ids(self) -> List[Optional[int]]:
+        """Pattern id of each feedback received, recorded by update_state."""
+        if len(self._observed_ids) != len(self.feedback_history):
+            # History was changed directly rather than through update_state
+            self._observed_ids = [self._observed_id(fb) for fb in self.feedback_history]
+        return self._observed_ids
+
+    def _constraint_scores(
+        self, words: List[str], codes: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Vectorized _constraint_score over many words at once.
+
+        Args:
+            words: Words to score
+            codes: encode_words(words), if already available
+        """
+        observed_ids = self._observed_pattern_ids()
+        if None in observed_ids:
+            # Unknown feedback formats keep the per-word fallback rules
+            return np.array([self._constraint_score(w) for w in words])
+
+        # Consistent with every guess so far: its pattern matches the observed one
+        if codes is None:
+            codes = encode_words(words)
+        consistent = np.ones(len(words), dtype=bool)
+        for guess, observed in zip(self.guess_history, observed_ids):
+            consistent &= pattern_ids(guess, codes) == observed
+        return consistent.astype(np.float64)
+
+    def _fitness_batch(
+        self, words: List[str], codes: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Vectorized _fitness over many words at once.
+
+        Args:
+            words: Words to score
+            codes: encode_words(words), if already available
+        """
+        if not words:
+            return np.zeros(0)
+        if codes is None:
+            codes = encode_words(words)
+        rows = np.arange(len(words))[:, None]
+
+        # Letter frequency over unique letters, plus the unique letters bonus
+        presence = np.zeros((len(words), 26), dtype=bool)
+        presence[rows, codes] = True
+        scores = presence @ self._freq_arr * 100 + presence.sum(axis=1) * 20
+
+        # Position diversity heuristic
+        scores = scores + self._pos_tab[np.arange(5), codes].sum(axis=1)
+
+        # Constraint satisfaction score if we have history
+        if self.guess_history:
+            scores = scores + self._constraint_scores(words, codes) * 50
+        return scores
+
+    def _population_fitness(self) -> List[Tuple[str, float]]:
+        """Fitness of every individual, with constraint scores computed in one batch."""
+        try:
+            # Only words not scored since the last feedback need computing
+            missing = [w for w in dict.fromkeys(self.population) if w not in self._fitness_cache]
+            self._fitness_cache.update(zip(missing, self._fitness_batch(missing).tolist()))
+            return [(word, self._fitness_cache[word]) for word in self.population]
+        except Exception:
+            logger.exception("Batched fitness failed; scoring per word.")
+
+        try:
+            constraint_scores = self._constraint_scores(self.population).tolist()
+        except Exception:
+            logger.exception("Batched constraint scoring failed; scoring per word.")
+            constraint_scores = [None] * len(self.population)
+
+        fitness_scores = []
+        for word, constraint_score in zip(self.population, constraint_scores):
+            try:
+                fitness_scores.append((word, self._fitness(word, constraint_score)))
+            except Exception:
+                logger.exception("Fitness computation failed for %s; skipping.", word)
+        return fitness_scores
+
     def _evolve_population(self) -> List[str]:
         """Evolve population for one generation with checks."""
         if not self.population:
@@ -214,12 +341,7 @@ class GeneticSolver(BaseSolver):
                 return []
 
         # Calculate fitness for all individuals
-        fitness_scores = []
-        for word in self.population:
-            try:
-                fitness_scores.append((word, self._fitness(word)))
-            except Exception:
-                logger.exception("Fitness computation failed for %s; skipping.", word)
+        fitness_scores = self._population_fitness()
 
         if not fitness_scores:
             logger.warning("No fitness scores computed; attempting to reseed population.")
@@ -227,117 +349,136 @@ class GeneticSolver(BaseSolver):
             # compute again as best-effort
             fitness_scores = [(w, self._fitness(w)) for w in self.population] if self.population else []
 
-        fitness_scores.sort(key=lambda x: x[1], reverse=True)
-
-        # Elitism: keep best individuals
-        new_population = [word for word, _ in fitness_scores[: self.elite_size]]
+        # Elitism: keep best individuals (no full sort needed)
+        elite = heapq.nlargest(self.elite_size, fitness_scores, key=lambda x: x[1])
+        new_population = [word for word, _ in elite]
 
         # If fitness_scores is small, allow duplicates from top performers
         if not fitness_scores:
             logger.error("Fitness scores empty after reseed; returning previous population safely.")
             return list(self.population)[: self.population_size]
 
-        # Fill rest with offspring
-        attempts = 0
-        max_attempts = self.population_size * 10  # avoid infinite loop
-        while len(new_population) < self.population_size and attempts < max_attempts:
-            attempts += 1
-            parent1 = self._tournament_selection(fitness_scores)
-            parent2 = self._tournament_selection(fitness_scores)
-
-            # Crossover
-            child = parent1
-            if random.random() < self.crossover_rate and parent1 and parent2:
-                child = self._crossover(parent1, parent2)
-
-            # Mutation
-            child = self._mutate(child)
-
-            # If child not valid, try to repair using valid/common words heuristic
-            if child not in self.possible_words:
-                # try to replace some letters with high-frequency letters
-                child = self._repair_candidate(child)
-
-            if child in self.possible_words and child not in new_population:
-                new_population.append(child)
+        # Breed every child first, then map them onto the feasible words in
+        # one batch, so every member is a possible word by construction
+        pool, weights = self._feasible_pool()
+        open_words = len(pool) - sum(
+            1 for word in new_population if word in self._index and self._alive[self._index[word]]
+        )
+        n_children = min(self.population_size - len(new_population), open_words)
+        parents = [word for word, _ in fitness_scores]
+        children = self._breed_children(
+            encode_words(parents), np.array([f for _, f in fitness_scores]), n_children
+        )
+        picks = self._place_children(children, set(new_population))
+        new_population.extend(pool[i] for i in picks)
+        scored = list(elite) + [(pool[i], float(weights[i])) for i in picks]
 
         # If we couldn't fill population, pad with top candidates
         if len(new_population) < self.population_size:
             logger.warning("Could not fill population by evolution; padding with top candidates.")
-            for word, _ in fitness_scores:
+            for word, _ in sorted(fitness_scores, key=lambda x: x[1], reverse=True):
                 if word not in new_population:
                     new_population.append(word)
                 if len(new_population) >= self.population_size:
                     break
 
-        return new_population[: self.population_size]
-
-    def _tournament_selection(self, fitness_scores: List[Tuple[str, float]]) -> str:
-        """Select individual using tournament selection (handles small pools)."""
-        if not fitness_scores:
-            return self._fallback_guess()
-
-        tournament_size = min(5, max(1, len(fitness_scores)))
-        tournament = random.sample(fitness_scores, tournament_size)
-        return max(tournament, key=lambda x: x[1])[0]
-
-    def _crossover(self, parent1: str, parent2: str) -> str:
-        """Single-point crossover with safety."""
-        if not parent1 or not parent2:
-            return parent1 or parent2 or self._fallback_guess()
-        point = random.randint(1, 4)
-        child = parent1[:point] + parent2[point:]
-        return child
-
-    def _mutate(self, word: str) -> str:
-        """Mutate a word but try to keep it valid where possible."""
-        if random.random() > self.mutation_rate:
-            return word
-
-        # Random mutation: change one letter to a high-frequency letter
-        word_list = list(word)
-        pos = random.randint(0, 4)
-        # pick replacement letter from frequency distribution or alphabet
-        if self.letter_frequencies:
-            letters, weights = zip(*self.letter_frequencies.items())
-            replacement = random.choices(letters, weights=weights, k=1)[0]
-        else:
-            replacement = random.choice("abcdefghijklmnopqrstuvwxyz")
-        word_list[pos] = replacement
-        candidate = "".join(word_list)
-
-        # If candidate is not in valid words, try to repair
-        if candidate not in self.possible_words:
-            candidate = self._repair_candidate(candidate)
-        return candidate
-
-    def _repair_candidate(self, candidate: str) -> str:
-        """Attempt to repair a candidate to a valid possible word."""
-        # 1) If any valid word with same pattern exists, pick it
-        #    (simple heuristic: swap letters with high-frequency ones)
-        try:
-            valids = set(self.word_list.get_valid_words() or [])
-            commons = list(self.word_list.get_common_words() or [])
-        except Exception:
-            valids = set()
-            commons = []
-
-        # try commons first
-        for w in commons:
-            if sum(a == b for a, b in zip(w, candidate)) >= 3:
-                return w
-
-        # try valids
-        for w in valids:
-            if sum(a == b for a, b in zip(w, candidate)) >= 3:
-                return w
-
-        # fallback to any possible word
-        if self.possible_words:
-            return next(iter(self.possible_words))
-
-        # ultimate fallback
-        return self._fallback_guess()
+        new_population = new_population[: self.population_size]
+        if len(scored) == len(new_population):
+            # Every member's fitness is already known; see _get_best_individual
+            self._scored_population = (new_population, scored)
+        return new_population
+
+    def _feasible_pool(self) -> Tuple[List[str], np.ndarray]:
+        """Possible words and their fitness, recomputed when the words change."""
+        words = self.possible_list
+        if self._feasible is None or self._feasible[0] is not words:
+            # possible_list is the alive rows of the solver's encoded words
+            self._feasible = (words, self._fitness_batch(words, self._codes[self._alive]))
+            self._fitness_cache.update(zip(words, self._feasible[1].tolist()))
+        return self._feasible
+
+    def _place_children(self, children: np.ndarray, chosen: Set[str]) -> List[int]:
+        """
+        Map a generation of children onto distinct feasible words.
+
+        Each child becomes the untaken possible word sharing the most letter
+        positions with it, the fittest among ties. Children that land on the
+        same word are replaced by fitness-proportionate draws from the rest
+        of the pool.
+
+        Args:
+            children: Letter codes of the offspring, possibly not words
+            chosen: Words already in the new population
+
+        Returns:
+            Positions in the feasible pool, at most one per child
+        """
+        words, weights = self._feasible_pool()
+        if not len(children) or not words:
+            return []
+        pool_codes = self._codes[self._alive]  # rows of the feasible pool
+        taken = np.fromiter((word in chosen for word in words), dtype=bool, count=len(words))
+
+        # Fitness only breaks ties: scaled into [0, 1) below one matching letter
+        tie_break = weights / (np.abs(weights).max() + 1)
+        tie_break[taken] = -np.inf
+
+        # Compare children against the whole pool in broadcast blocks
+        nearest = np.empty(len(children), dtype=np.intp)
+        for start in range(0, len(children), self.PLACEMENT_BLOCK):
+            block = children[start : start + self.PLACEMENT_BLOCK, None, :]
+            matches = (block == pool_codes[None, :, :]).sum(axis=2)
+            nearest[start : start + len(matches)] = (matches + tie_break).argmax(axis=1)
+
+        # Keep the first child to reach each word
+        _, first = np.unique(nearest, return_index=True)
+        picks = nearest[np.sort(first)]
+        picks = picks[~taken[picks]]
+        taken[picks] = True
+
+        # Refill collisions by roulette over the words still open
+        open_slots = np.flatnonzero(~taken)
+        n_extra = min(len(children) - len(picks), len(open_slots))
+        if n_extra > 0:
+            p = weights[open_slots]
+            extra = self._rng.choice(open_slots, size=n_extra, replace=False, p=p / p.sum())
+            picks = np.concatenate([picks, extra])
+        return picks.tolist()
+
+    def _breed_children(self, parents: np.ndarray, fitness: np.ndarray, n: int) -> np.ndarray:
+        """
+        Breed a generation of children by tournament selection, crossover and mutation.
+
+        Every random number the generation needs is drawn up front, so the
+        operators work on whole arrays instead of one event at a time.
+
+        Args:
+            parents: (P, 5) letter codes of the current population
+            fitness: Fitness of each parent
+            n: Number of children to breed
+
+        Returns:
+            (n, 5) letter codes of the children, possibly not words
+        """
+        u = self._rng.random((n, 2))  # crossover and mutation events
+        pts = self._rng.integers(1, 5, size=n)  # crossover points
+        tourn_idx = self._rng.integers(0, len(parents), size=(n, 2, 5))  # two tournaments each
+        mut_pos = self._rng.integers(0, 5, size=n)
+        mut_letter = self._rng.choice(26, size=n, p=self._mutation_p)
+
+        # Tournament selection: the fittest entrant of each tournament
+        best = fitness[tourn_idx].argmax(axis=2)
+        winners = np.take_along_axis(tourn_idx, best[..., None], axis=2)[..., 0]
+        parent1, parent2 = parents[winners[:, 0]], parents[winners[:, 1]]
+
+        # Single-point crossover with probability crossover_rate
+        from_parent2 = (np.arange(5) >= pts[:, None]) & (u[:, :1] < self.crossover_rate)
+        children = np.where(from_parent2, parent2, parent1)
+
+        # Mutation: one letter, drawn by letter frequency, with probability mutation_rate
+        mutated = np.flatnonzero(u[:, 1] < self.mutation_rate)
+        children[mutated, mut_pos[mutated]] = mut_letter[mutated]
+        return children
 
     def _get_best_individual(self) -> str:
         """Get best individual from current population (safe + UI enabled)."""
@@ -346,27 +487,24 @@ class GeneticSolver(BaseSolver):
         if not self.population:
             return self._fallback_guess()
 
-        fitness_scores = []
-
-        # Safely calculate fitness for each word
-        for word in self.population:
-            try:
-                score = self._fitness(word)
-                fitness_scores.append((word, score))
-            except Exception:
-                logger.exception("Fitness error for %s", word)
+        # Reuse the scores from evolving this population, else compute them
+        scored = self._scored_population
+        if scored is not None and scored[0] is self.population:
+            fitness_scores = scored[1]
+        else:
+            fitness_scores = self._population_fitness()
 
         # If all fitness evaluations failed
         if not fitness_scores:
             return self._fallback_guess()
 
-        # Sort by fitness (highest first)
-        fitness_scores.sort(key=lambda x: x[1], reverse=True)
+        # Top top_k by fitness (highest first)
+        top = heapq.nlargest(self.top_k, fitness_scores, key=lambda x: x[1])
 
-        # Update UI candidate list (top 5)
+        # Update UI candidate list
         self.candidates = [
             {"word": word, "score": f"{score:.2f}"}
-            for word, score in fitness_scores[:5]
+            for word, score in top
         ]
 
         # Metadata for the UI
@@ -374,11 +512,11 @@ class GeneticSolver(BaseSolver):
             "method": "Genetic Algorithm",
             "population_size": len(self.population),
             "generation": self.generation,
-            "total_candidates": len(self.possible_words),
+            "total_candidates": self.num_possible,
         }
 
         # Best word is the first after sorting
-        best_word = fitness_scores[0][0]
+        best_word = top[0][0]
         return best_word
 
 
@@ -386,90 +524,62 @@ class GeneticSolver(BaseSolver):
         """Update solver state based on feedback and reset population appropriately."""
         if guess:
             self.guess_history.append(guess)
+        observed_ids = self._observed_pattern_ids()  # in sync before appending
         self.feedback_history.append(feedback)
+        observed_ids.append(self._observed_id(feedback))
+        self._fitness_cache.clear()  # constraint scores depend on the history
+        self._scored_population = None
 
-        # Filter possible words using BaseSolver method if available (protected)
-        before = len(self.possible_words)
+        # Filter possible words (exact filter, conservative fallback)
+        before = self.num_possible
         try:
-            if hasattr(super(), "_filter_words_by_feedback"):
-                try:
-                    super()._filter_words_by_feedback(guess, feedback)
-                except Exception:
-                    logger.exception("BaseSolver._filter_words_by_feedback failed; performing conservative local filter.")
-                    self._local_filter(guess, feedback)
-            else:
-                self._local_filter(guess, feedback)
+            self._apply_feedback(guess, feedback)
         except Exception:
             logger.exception("Error during filtering step.")
 
-        after = len(self.possible_words)
+        after = self.num_possible
         logger.info("Genetic update_state: possible_words before=%d after=%d", before, after)
 
         # Reset population to force re-initialization in next generation
         self.population = []
         self.generation = 0
 
-        if not self.possible_words:
+        if not self.num_possible:
             logger.warning("possible_words empty after update_state; attempting recovery.")
             self._recover_possible_words()
 
-    def _local_filter(self, guess: str, feedback: Feedback) -> None:
-        """Conservative local filtering fallback (similar to RL local filter)."""
-        statuses = getattr(feedback, "feedback", None)
-        if statuses is None:
-            logger.debug("Feedback object missing .feedback; skipping local filter.")
-            return
-
-        keep = set(self.possible_words)
-        for i, status in enumerate(statuses):
-            letter = guess[i]
-            if status == LetterStatus.CORRECT:
-                keep = {w for w in keep if len(w) > i and w[i] == letter}
-            elif status == LetterStatus.ABSENT:
-                # conservative: remove words that have letter at all
-                keep = {w for w in keep if letter not in w}
-            elif status == LetterStatus.PRESENT:
-                keep = {w for w in keep if (letter in w and (len(w) <= i or w[i] != letter))}
-        if keep:
-            self.possible_words = keep
-        else:
-            logger.debug("Local filter would remove all words; preserving previous possible_words to avoid empty set.")
-
     def _recover_possible_words(self) -> None:
         """Attempt to recover possible_words when the set becomes empty."""
         logger.info("Attempting to recover possible_words for GeneticSolver.")
-        try:
-            valids = set(self.word_list.get_valid_words() or [])
-            commons = set(self.word_list.get_common_words() or [])
-        except Exception:
-            valids = set()
-            commons = set()
+        valids = self._valids_set
+        commons = self._commons_set
 
-        candidates = (commons & valids) or valids or commons
+        candidates = self._recovery_pool
         if candidates:
-            candidates = {w for w in candidates if w not in set(self.guess_history)}
+            candidates = candidates - set(self.guess_history)
             if candidates:
-                self.possible_words = set(candidates)
-                logger.info("Recovered possible_words with %d candidates.", len(self.possible_words))
+                self.possible_words = candidates
+                logger.info("Recovered possible_words with %d candidates.", self.num_possible)
                 return
 
         all_candidates = set(self.guess_history) | valids | commons
         if all_candidates:
             self.possible_words = all_candidates
-            logger.info("Recovered possible_words from history/valids/commons; size=%d", len(self.possible_words))
+            logger.info("Recovered possible_words from history/valids/commons; size=%d", self.num_possible)
             return
 
         logger.error("Unable to recover any possible words; possible_words remains empty.")
 
     def reset(self) -> None:
         """Reset solver state for a new game (preserve some learned data if desired)."""
-        super().reset()
-        try:
-            valid_words = list(self.word_list.get_valid_words() or [])
-        except Exception:
-            valid_words = []
-        self.possible_words = set(valid_words)
+        super().reset()  # refills possible_words from _initial_words
+        self._first_guess = self._get_first_guess()
+        # Re-seed so a configured seed reproduces every game, not just the first
+        self._rng = np.random.default_rng(self.config.get("seed"))
         self.population = []
         self.generation = 0
         self.guess_history = []
         self.feedback_history = []
+        self._observed_ids = []
+        self._fitness_cache.clear()
+        self._scored_population = None
@@ -2,12 +2,12 @@
 Knowledge-based solver using rule-based reasoning.
 """
 
-from typing import List, Dict, Set
+from typing import List, Dict, Set, Tuple
 from solvers.base_solver import BaseSolver
 from core.feedback import Feedback, LetterStatus
 from core.word_list import WordList
-from collections import Counter
 import logging
+import numpy as np
 
 logger = logging.getLogger(__name__)
 
@@ -15,138 +15,203 @@ logger = logging.getLogger(__name__)
 class KnowledgeBasedSolver(BaseSolver):
     """Wordle solver using knowledge-based rules and inference."""
 
+    # Words with most common letters in optimal positions
+    STARTING_WORDS = ("slate", "crane", "stare", "arise", "raise")
+
     def __init__(self, word_list: WordList, config: dict = None):
         super().__init__(word_list, config)
         self.confirmed_letters: Dict[int, str] = {}  # position -> letter
-        self.present_letters: Set[str] = set()  # letters in word but position unknown
-        self.absent_letters: Set[str] = set()  # letters not in word
+        # Letter sets as 26-bit masks, bit ord(c) - 97 per letter
+        self._present_mask = 0  # letters in word but position unknown
+        self._absent_mask = 0  # letters not in word
         self.excluded_positions: Dict[str, Set[int]] = (
             {}
         )  # letter -> positions to avoid
+        # Words satisfying every rule learned so far; rules only ever narrow
+        self._rule_alive = np.ones(len(self._words), dtype=bool)
 
         # Letter frequency analysis
         self.letter_freq = self._analyze_letter_frequency()
         self.position_freq = self._analyze_position_frequency()
+        # Per-word scoring features aligned with self._words, built lazily
+        self._feature_words = None
+        self._feature_matrix = None
+        self._first_guess = self._get_first_guess()
 
     def _analyze_letter_frequency(self) -> Dict[str, float]:
         """Analyze frequency of letters across all words."""
-        freq = Counter()
-        total = 0
-
-        for word in self.word_list.get_common_words():
-            for letter in set(word):
-                freq[letter] += 1
-                total += 1
+        # Words containing each letter, shared with other solvers
+        freq = self.word_list.get_letter_frequencies()
+        total = sum(freq.values())
 
         return {letter: count / total for letter, count in freq.items()}
 
     def _analyze_position_frequency(self) -> List[Dict[str, float]]:
         """Analyze frequency of letters at each position."""
-        position_freq = [{} for _ in range(5)]
-
-        for word in self.word_list.get_common_words():
-            for i, letter in enumerate(word):
-                position_freq[i][letter] = position_freq[i].get(letter, 0) + 1
+        # Per-position letter counts, shared with other solvers
+        counts = self.word_list.get_position_counts()
+        freqs = counts / np.maximum(counts.sum(axis=1, keepdims=True), 1)
 
-        # Normalize
-        for i in range(5):
-            total = sum(position_freq[i].values())
-            position_freq[i] = {k: v / total for k, v in position_freq[i].items()}
-
-        return position_freq
+        return [
+            {chr(ord("a") + c): float(freqs[i, c]) for c in np.flatnonzero(counts[i])}
+            for i in range(5)
+        ]
 
     def get_next_guess(self) -> str:
         """Get next guess using knowledge-based rules."""
         if not self.guess_history:
-            return self._get_first_guess()
+            return self._first_guess
 
         # Apply rules to filter candidates
         candidates = self._apply_rules()
 
-        if not candidates:
+        if not candidates.any():
             logger.warning("No candidates found, using fallback")
             return self._get_fallback_guess()
 
-        if len(candidates) == 1:
-            return list(candidates)[0]
+        if candidates.sum() == 1:
+            return str(self._words[candidates][0])
 
         # Score and select best candidate
         return self._score_candidates(candidates)
 
     def _get_first_guess(self) -> str:
         """Get optimal first guess based on letter frequency."""
-        # Use words with most common letters in optimal positions
-        best_words = ["slate", "crane", "stare", "arise", "raise"]
-
-        for word in best_words:
-            if word in self.possible_words:
-                return word
-
-        return list(self.possible_words)[0]
+        return next(
+            (word for word in self.STARTING_WORDS if word in self.possible_words),
+            self.possible_list[0],
+        )
 
-    def _apply_rules(self) -> Set[str]:
-        """Apply knowledge-based rules to filter candidates."""
-        candidates = set(self.possible_words)
+    def _apply_rules(self) -> np.ndarray:
+        """
+        Apply knowledge-based rules to filter candidates.
+
+        Returns:
+            Boolean mask over the solver's word array marking candidates
+        """
+        return self._alive & self._rule_alive
+
+    def _rule_mask(
+        self,
+        confirmed: Dict[int, str],
+        present_mask: int,
+        absent_mask: int,
+        excluded: List[Tuple[str, int]],
+    ) -> np.ndarray:
+        """
+        Words satisfying a batch of rules.
+
+        Args:
+            confirmed: Position -> letter known to be there
+            present_mask: Bitmask of letters known to be in the word
+            absent_mask: Bitmask of letters known not to be in the word
+            excluded: (letter, position) pairs the letter cannot occupy
+
+        Returns:
+            Boolean mask over the solver's word array
+        """
+        alive = np.ones(len(self._words), dtype=bool)
+
+        # Rules 2 and 3: must contain all present letters and none of the
+        # absent ones, checked against each word's letter-presence bits
+        present_mask = np.uint32(present_mask)
+        absent_mask = np.uint32(absent_mask)
+        alive &= (self._letter_bits & present_mask) == present_mask
+        alive &= (self._letter_bits & absent_mask) == 0
 
         # Rule 1: Must have confirmed letters at correct positions
-        for pos, letter in self.confirmed_letters.items():
-            candidates = {w for w in candidates if w[pos] == letter}
-
-        # Rule 2: Must contain all present letters
-        for letter in self.present_letters:
-            candidates = {w for w in candidates if letter in w}
-
-        # Rule 3: Must not contain absent letters
-        for letter in self.absent_letters:
-            candidates = {w for w in candidates if letter not in w}
+        for pos, letter in confirmed.items():
+            alive &= self._codes[:, pos] == ord(letter) - ord("a")
 
         # Rule 4: Present letters must not be in excluded positions
-        for letter, positions in self.excluded_positions.items():
-            for pos in positions:
-                candidates = {w for w in candidates if w[pos] != letter}
-
-        return candidates
-
-    def _score_candidates(self, candidates: Set[str]) -> str:
-        """Score candidates using multiple heuristics."""
-        scores = {}
-
-        for word in candidates:
-            score = 0
-
-            # Heuristic 1: Letter frequency
-            for letter in set(word):
-                score += self.letter_freq.get(letter, 0) * 100
-
-            # Heuristic 2: Position-specific frequency
-            for i, letter in enumerate(word):
-                score += self.position_freq[i].get(letter, 0) * 50
-
-            # Heuristic 3: Number of unique letters (exploration)
-            unique_letters = len(set(word))
-            if len(self.guess_history) < 2:
-                score += unique_letters * 30  # Prefer diverse letters early
-
-            # Heuristic 4: Avoid repeated letters if we have knowledge
-            if len(self.confirmed_letters) > 0:
-                repeated = len(word) - len(set(word))
-                score -= repeated * 20
-
-            scores[word] = score
+        for letter, pos in excluded:
+            alive &= self._codes[:, pos] != ord(letter) - ord("a")
+
+        return alive
+
+    @property
+    def present_letters(self) -> Set[str]:
+        """Letters known to be in the word, position unknown."""
+        return self._mask_letters(self._present_mask)
+
+    @property
+    def absent_letters(self) -> Set[str]:
+        """Letters known not to be in the word."""
+        return self._mask_letters(self._absent_mask)
+
+    @staticmethod
+    def _mask_letters(mask: int) -> Set[str]:
+        """Letters whose bit (``ord(c) - 97``) is set in a letter bitmask."""
+        return {chr(ord("a") + k) for k in range(26) if mask >> k & 1}
+
+    def _features(self) -> np.ndarray:
+        """
+        Game-independent scoring features of every word, built once.
+
+        Returns:
+            Array of shape (N, 3) holding each word's letter + position
+            frequency score, unique letter count and repeated letter count
+        """
+        if self._feature_words is not self._words:
+            letters = [chr(ord("a") + k) for k in range(26)]
+            freq_vec = np.array([self.letter_freq.get(c, 0) for c in letters])
+            pos_tab = np.array(
+                [[self.position_freq[i].get(c, 0) for c in letters] for i in range(5)]
+            )
+            presence = (
+                (self._letter_bits[:, None] >> np.arange(26, dtype=np.uint32)) & 1
+            ).astype(bool)
+            unique = presence.sum(axis=1)
+
+            self._feature_matrix = np.column_stack(
+                [
+                    # Heuristic 1: Letter frequency
+                    presence @ freq_vec * 100
+                    # Heuristic 2: Position-specific frequency
+                    + pos_tab[np.arange(5), self._codes].sum(axis=1) * 50,
+                    unique,
+                    self._codes.shape[1] - unique,
+                ]
+            )
+            self._feature_words = self._words
+        return self._feature_matrix
+
+    def _score_candidates(self, candidates: np.ndarray) -> str:
+        """
+        Score candidates using multiple heuristics.
+
+        Args:
+            candidates: Boolean mask over the solver's word array
+
+        Returns:
+            Highest scoring candidate
+        """
+        weights = np.array(
+            [
+                1.0,
+                # Heuristic 3: Prefer diverse letters early (exploration)
+                30.0 if len(self.guess_history) < 2 else 0.0,
+                # Heuristic 4: Avoid repeated letters if we have knowledge
+                -20.0 if self.confirmed_letters else 0.0,
+            ]
+        )
+        idx = np.flatnonzero(candidates)
+        scores = self._features()[idx] @ weights
+        order = self._top_indices(scores, self.top_k)
+        sorted_scores = [(str(self._words[idx[i]]), float(scores[i])) for i in order]
 
-        # Sort and update candidates for UI
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        # Update candidates for UI
         self.candidates = [
             {"word": word, "score": f"{score:.0f}"}
-            for word, score in sorted_scores[:5]
+            for word, score in sorted_scores
         ]
         
         self.selection_info = {
             "method": "Rule-Based Reasoning",
             "confirmed_letters": len(self.confirmed_letters),
-            "present_letters": len(self.present_letters),
-            "candidates_evaluated": len(scores),
-            "total_remaining": len(self.possible_words),
+            "present_letters": bin(self._present_mask).count("1"),
+            "candidates_evaluated": len(idx),
+            "total_remaining": self.num_possible,
         }
 
         # Return highest scoring word
@@ -154,8 +219,8 @@ class KnowledgeBasedSolver(BaseSolver):
 
     def _get_fallback_guess(self) -> str:
         """Fallback when no candidates found."""
-        if self.possible_words:
-            return list(self.possible_words)[0]
+        if self.num_possible:
+            return self.possible_list[0]
         return "slate"
 
     def update_state(self, guess: str, feedback: Feedback) -> None:
@@ -163,41 +228,60 @@ class KnowledgeBasedSolver(BaseSolver):
         self.guess_history.append(guess)
         self.feedback_history.append(feedback)
 
-        # Extract knowledge from feedback
+        # Extract knowledge from feedback, keeping what is new this turn
+        new_confirmed: Dict[int, str] = {}
+        new_present = 0
+        new_absent = 0
+        new_excluded: List[Tuple[str, int]] = []
         for i, (letter, status) in enumerate(zip(guess, feedback.feedback)):
+            bit = 1 << (ord(letter) - ord("a"))
             if status == LetterStatus.CORRECT:
+                if self.confirmed_letters.get(i) != letter:
+                    new_confirmed[i] = letter
                 self.confirmed_letters[i] = letter
                 # Remove from present letters if it was there
-                self.present_letters.discard(letter)
+                self._present_mask &= ~bit
 
             elif status == LetterStatus.PRESENT:
-                self.present_letters.add(letter)
+                if not self._present_mask & bit:
+                    new_present |= bit
+                self._present_mask |= bit
                 # Add position to excluded positions
                 if letter not in self.excluded_positions:
                     self.excluded_positions[letter] = set()
+                if i not in self.excluded_positions[letter]:
+                    new_excluded.append((letter, i))
                 self.excluded_positions[letter].add(i)
 
             elif status == LetterStatus.ABSENT:
                 # Only add to absent if not confirmed or present elsewhere
                 if (
                     letter not in self.confirmed_letters.values()
-                    and letter not in self.present_letters
+                    and not (self._present_mask | self._absent_mask) & bit
                 ):
-                    self.absent_letters.add(letter)
+                    new_absent |= bit
+                    self._absent_mask |= bit
+
+        # Earlier rules still hold, so only this turn's rules are applied
+        self._rule_alive &= self._rule_mask(
+            new_confirmed, new_present, new_absent, new_excluded
+        )
 
         # Filter possible words
         self._filter_words_by_feedback(guess, feedback)
 
         logger.info(
-            f"KB: {len(self.possible_words)} words remaining. "
+            f"KB: {self.num_possible} words remaining. "
             f"Confirmed: {len(self.confirmed_letters)}, "
-            f"Present: {len(self.present_letters)}"
+            f"Present: {bin(self._present_mask).count('1')}"
         )
 
     def reset(self) -> None:
         """Reset solver state."""
         super().reset()
         self.confirmed_letters = {}
-        self.present_letters = set()
-        self.absent_letters = set()
+        self._present_mask = 0
+        self._absent_mask = 0
         self.excluded_positions = {}
+        self._rule_alive = np.ones(len(self._words), dtype=bool)
+        self._first_guess = self._get_first_guess()
@@ -2,7 +2,7 @@
 Reinforcement Learning solver for Wordle.
 """
 
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Sequence
 from solvers.base_solver import BaseSolver
 from core.feedback import Feedback
 from core.word_list import WordList
@@ -17,6 +17,8 @@ if not logger.handlers:
 class RLSolver(BaseSolver):
     """Wordle solver using Reinforcement Learning (simplified Q-learning)."""
 
+    STARTING_WORDS = ("slate", "crane", "stare", "raise", "arise")
+
     def __init__(self, word_list: WordList, config: dict = None):
         super().__init__(word_list, config)
         self.config = config or {}
@@ -25,50 +27,59 @@ class RLSolver(BaseSolver):
         # Q-values placeholder (not used in this simplified version)
         self.q_values = {}
 
-        # Ensure possible_words exists (BaseSolver may set it; be safe)
-        valid_words = list(self.word_list.get_valid_words() or [])
-        self.possible_words = set(valid_words)
+        # possible_words starts as every valid word, see _initial_words
 
         # Track history (BaseSolver may set these; ensure they exist)
         self.guess_history = getattr(self, "guess_history", [])
         self.feedback_history = getattr(self, "feedback_history", [])
 
-        # Letter position preferences learned over time
+        # Letter position preferences learned over time, kept across reset()
+        # unless keep_preferences is off
+        self.keep_preferences = bool(self.config.get("keep_preferences", True))
         self.position_preferences = self._initialize_preferences()
+        self._first_guess = self._get_first_guess()
+
+    def _initial_words(self) -> Sequence[str]:
+        """Every valid word is a candidate before any feedback."""
+        return self.word_list.get_valid_words() or ()
 
-    def _initialize_preferences(self) -> List[Dict[str, float]]:
-        """Initialize position preferences from word frequency."""
-        preferences = [{} for _ in range(5)]
+    def _initialize_preferences(self) -> np.ndarray:
+        """
+        Initialize position preferences from word frequency.
 
+        Returns:
+            Array of shape (5, 26); row i is a distribution over letters at position i
+        """
         try:
-            common_words = list(self.word_list.get_common_words() or [])
+            # Per-position letter counts over the common words, cached by the word list
+            counts = self.word_list.get_position_counts()
         except Exception:
-            common_words = []
+            counts = None
 
-        if not common_words:
+        if counts is not None and counts.any():
+            preferences = counts.astype(float)
+        else:
             # Fall back to some commonly recommended starters if no list
-            common_words = ["slate", "crane", "stare", "raise", "arise"]
-
-        for word in common_words:
-            for i, letter in enumerate(word):
-                preferences[i][letter] = preferences[i].get(letter, 0) + 1
+            preferences = np.zeros((5, 26))
+            for word in ["slate", "crane", "stare", "raise", "arise"]:
+                for i, letter in enumerate(word):
+                    preferences[i, ord(letter) - ord("a")] += 1
 
-        for i in range(5):
-            total = sum(preferences[i].values())
-            if total > 0:
-                preferences[i] = {k: v / total for k, v in preferences[i].items()}
-            else:
-                preferences[i] = {}
+        return self._normalize_preferences(preferences)
 
-        return preferences
+    @staticmethod
+    def _normalize_preferences(preferences: np.ndarray) -> np.ndarray:
+        """Scale each non-empty row of a preference table to sum to one."""
+        totals = preferences.sum(axis=1, keepdims=True)
+        return np.divide(preferences, totals, out=preferences.copy(), where=totals > 0)
 
     def get_next_guess(self) -> str:
         """Get next guess using epsilon-greedy policy with safe fallbacks."""
         # Ensure possible_words is not empty; if it is, recover
-        if not self.possible_words:
+        if not self.num_possible:
             logger.warning("possible_words empty at get_next_guess(); attempting recovery.")
             self._recover_possible_words()
-            if not self.possible_words:
+            if not self.num_possible:
                 # As a final fallback, return a safe common word or first valid word
                 fallback = self._fallback_guess()
                 logger.error("Recovery failed; returning fallback guess: %s", fallback)
@@ -76,15 +87,15 @@ class RLSolver(BaseSolver):
 
         try:
             if not self.guess_history:
-                return self._get_first_guess()
+                return self._first_guess
 
-            if len(self.possible_words) == 1:
+            if self.num_possible == 1:
                 return next(iter(self.possible_words))
 
             # Epsilon-greedy action selection
             if np.random.random() < self.epsilon:
                 # Explore: random valid word from possible_words
-                return np.random.choice(list(self.possible_words))
+                return np.random.choice(self.possible_list)
             else:
                 # Exploit: use learned policy
                 return self._select_best_action()
@@ -94,17 +105,16 @@ class RLSolver(BaseSolver):
 
     def _get_first_guess(self) -> str:
         """Get first guess based on learned preferences."""
-        starting_words = ["slate", "crane", "stare", "raise", "arise"]
-        for word in starting_words:
-            if word in self.possible_words:
-                return word
-        # fallback to any common/valid word
-        return self._fallback_guess()
+        return next(
+            (word for word in self.STARTING_WORDS if word in self.possible_words),
+            # fallback to any common/valid word
+            self._fallback_guess(),
+        )
 
     def _fallback_guess(self) -> str:
         """Safe fallback guess (prefer common words, else any valid)."""
-        commons = list(self.word_list.get_common_words() or [])
-        valids = list(self.word_list.get_valid_words() or [])
+        commons = self.word_list.get_common_words()
+        valids = self.word_list.get_valid_words()
         if commons:
             return commons[0]
         if valids:
@@ -114,55 +124,56 @@ class RLSolver(BaseSolver):
     def _select_best_action(self) -> str:
         """Select best action based on current policy."""
         # Fail-safe: if no possible words remain
-        if not self.possible_words:
+        if not self.num_possible:
             logger.error("RL Solver Error: No possible words remaining in _select_best_action.")
             # try to recover
             self._recover_possible_words()
-            if not self.possible_words:
+            if not self.num_possible:
                 return self._fallback_guess()
 
-        scores = {}
-        for word in list(self.possible_words):
-            try:
-                score = self._evaluate_word(word)
-                scores[word] = score
-            except Exception:
-                logger.exception("Error evaluating word %s; skipping.", word)
-
-        if not scores:
-            logger.warning("No scores computed in _select_best_action; using fallback.")
-            return self._fallback_guess()
+        idx = np.flatnonzero(self._alive)
+        scores = self._evaluate_words(idx)
 
-        # Sort by score
-        sorted_scores = sorted(scores.items(), key=lambda x: x[1], reverse=True)
+        # Best few by score; ties keep alphabetical order
+        order = self._top_indices(scores, self.top_k)
+        sorted_scores = [(str(self._words[idx[i]]), float(scores[i])) for i in order]
         
         # Update candidates for UI
         self.candidates = [
             {"word": word, "score": f"{score:.2f}"}
-            for word, score in sorted_scores[:5]
+            for word, score in sorted_scores
         ]
         
         self.selection_info = {
             "method": "Reinforcement Learning",
             "epsilon": self.epsilon,
             "exploration_mode": np.random.random() < self.epsilon,
-            "candidates_evaluated": len(scores),
-            "total_remaining": len(self.possible_words),
+            "candidates_evaluated": len(idx),
+            "total_remaining": self.num_possible,
         }
 
         # Return highest scoring word
         return sorted_scores[0][0]
 
-    def _evaluate_word(self, word: str) -> float:
-        """Evaluate a word using learned preferences."""
-        score = 0.0
-        for i, letter in enumerate(word):
-            score += self.position_preferences[i].get(letter, 0) * 10
-        unique_letters = len(set(word))
-        score += unique_letters * 2
-        if len(self.guess_history) < 2:
-            score += unique_letters * 3
-        return score
+    def _evaluate_words(self, idx: np.ndarray) -> np.ndarray:
+        """
+        Evaluate words using learned preferences.
+
+        Args:
+            idx: Indices into the solver's word array
+
+        Returns:
+            Score of each indexed word
+        """
+        prefs = self.position_preferences
+        codes = self._codes[idx]
+        score = prefs[np.arange(5), codes].sum(axis=1) * 10
+
+        # Distinct letters: popcount of each word's letter-presence bits
+        bits = self._letter_bits[idx]
+        unique_letters = ((bits[:, None] >> np.arange(26, dtype=np.uint32)) & 1).sum(axis=1)
+        bonus = 2 + (3 if len(self.guess_history) < 2 else 0)
+        return score + unique_letters * bonus
 
     def update_state(self, guess: str, feedback: Feedback) -> None:
         """Update learned policy based on feedback."""
@@ -176,68 +187,20 @@ class RLSolver(BaseSolver):
             logger.exception("Error in _update_preferences")
 
         # Filtering possible words may reduce set size
-        before = len(self.possible_words)
+        before = self.num_possible
         try:
-            # Use BaseSolver's filtering if available, else attempt a simple filter
-            if hasattr(super(), "_filter_words_by_feedback"):
-                # If BaseSolver implements it, call it. Protect with try/except.
-                try:
-                    super()._filter_words_by_feedback(guess, feedback)
-                    # assume BaseSolver updates self.possible_words
-                except Exception:
-                    logger.exception("BaseSolver._filter_words_by_feedback failed, attempting local filter.")
-                    self._local_filter(guess, feedback)
-            else:
-                # fallback local filter
-                self._local_filter(guess, feedback)
+            # Exact filter, with a conservative local filter as fallback
+            self._apply_feedback(guess, feedback)
         except Exception:
             logger.exception("Filtering step failed for guess %r", guess)
 
-        after = len(self.possible_words)
+        after = self.num_possible
         logger.info("RL update_state: possible_words before=%d after=%d", before, after)
 
-        if not self.possible_words:
+        if not self.num_possible:
             logger.warning("possible_words became empty after filtering - attempting recovery")
             self._recover_possible_words()
 
-    def _local_filter(self, guess: str, feedback: Feedback) -> None:
-        """
-        Conservative local filtering as a backup when BaseSolver filtering is unavailable or fails.
-        This will attempt only to remove words that contradict GREEN (correct) letters and ABSENT with
-        certainty, and will be intentionally lenient for YELLOW-like feedback to avoid over-pruning.
-        """
-        from core.feedback import LetterStatus
-
-        keep = set(self.possible_words)
-        if not guess or not feedback:
-            return
-
-        # If feedback.feedback is a sequence of statuses or tuples, attempt to interpret it.
-        statuses = getattr(feedback, "feedback", None)
-        if statuses is None:
-            # unknown format; skip aggressive filtering
-            logger.debug("Feedback object missing .feedback attribute; skipping local filter")
-            return
-
-        for i, status in enumerate(statuses):
-            letter = guess[i]
-            if status == LetterStatus.CORRECT:
-                keep = {w for w in keep if len(w) > i and w[i] == letter}
-            elif status == LetterStatus.ABSENT:
-                # If letter occurs multiple times in guess, conservative: remove words that have letter
-                keep = {w for w in keep if letter not in w}
-            elif status == LetterStatus.PRESENT:
-                # YELLOW-ish: ensure letter present but not at position i
-                keep = {w for w in keep if (letter in w and (len(w) <= i or w[i] != letter))}
-            else:
-                # unknown status: be conservative
-                pass
-
-        if keep:
-            self.possible_words = keep
-        else:
-            logger.debug("Local filter would remove all words; keeping previous set to avoid empty set.")
-
     def _recover_possible_words(self) -> None:
         """Attempt to recover possible_words set when it becomes empty."""
         logger.info("Attempting to recover possible_words.")
@@ -252,17 +215,17 @@ class RLSolver(BaseSolver):
         candidates = (commons & valids) or valids or commons
         if candidates:
             # try to remove words already guessed (to avoid repetition)
-            candidates = {w for w in candidates if w not in set(self.guess_history)}
+            candidates = candidates - set(self.guess_history)
             if candidates:
                 self.possible_words = set(candidates)
-                logger.info("Recovered possible_words with %d candidates.", len(self.possible_words))
+                logger.info("Recovered possible_words with %d candidates.", self.num_possible)
                 return
 
         # Last resort: allow previously guessed words (to allow completion)
         all_candidates = set(self.guess_history) | set(valids) | set(commons)
         if all_candidates:
             self.possible_words = all_candidates
-            logger.info("Recovered possible_words from history/valids/commons; size=%d", len(self.possible_words))
+            logger.info("Recovered possible_words from history/valids/commons; size=%d", self.num_possible)
             return
 
         # Nothing available; keep possible_words empty (caller will fallback)
@@ -279,26 +242,27 @@ class RLSolver(BaseSolver):
             logger.debug("Feedback object missing .feedback; skipping preference update.")
             return
 
+        prefs = self.position_preferences
+        changed = []
         for i, status in enumerate(statuses):
-            letter = guess[i]
+            letter = ord(guess[i]) - ord("a")
             if status == LetterStatus.CORRECT:
-                current = self.position_preferences[i].get(letter, 0)
-                self.position_preferences[i][letter] = current + learning_rate
+                prefs[i, letter] += learning_rate
+                changed.append(i)
             elif status == LetterStatus.ABSENT:
-                current = self.position_preferences[i].get(letter, 0)
-                self.position_preferences[i][letter] = max(0, current - learning_rate * 0.5)
+                prefs[i, letter] = max(0, prefs[i, letter] - learning_rate * 0.5)
+                changed.append(i)
 
-        # Re-normalize
-        for i in range(5):
-            total = sum(self.position_preferences[i].values())
-            if total > 0:
-                self.position_preferences[i] = {k: v / total for k, v in self.position_preferences[i].items()}
+        # Re-normalize only the rows that were updated
+        if changed:
+            prefs[changed] = self._normalize_preferences(prefs[changed])
 
     def reset(self) -> None:
         """Reset solver state."""
-        super().reset()
-        valid_words = list(self.word_list.get_valid_words() or [])
-        self.possible_words = set(valid_words)
+        super().reset()  # refills possible_words from _initial_words
         self.guess_history = []
         self.feedback_history = []
-        # keep learned preferences across games (optional) - do not reset position_preferences here
+        self._first_guess = self._get_first_guess()
+        # keep learned preferences across games unless configured otherwise
+        if not self.keep_preferences:
+            self.position_preferences = self._initialize_preferences()
@@ -2,25 +2,31 @@
 Factory for creating solver instances.
 """
 
-from typing import Dict, Type
+import importlib
+from typing import Dict, Tuple, Type
 from solvers.base_solver import BaseSolver
-from solvers.csp.csp_solver import CSPSolver
-from solvers.knowledge_based.kb_solver import KnowledgeBasedSolver
-from solvers.bayesian.bayesian_solver import BayesianSolver
-from solvers.reinforcement_learning.rl_solver import RLSolver
-from solvers.genetic.genetic_solver import GeneticSolver
 from core.word_list import WordList
 
 
 class SolverFactory:
     """Factory for creating solver instances."""
 
-    _solvers: Dict[str, Type[BaseSolver]] = {
-        "csp": CSPSolver,
-        "knowledge_based": KnowledgeBasedSolver,
-        "bayesian": BayesianSolver,
-        "reinforcement_learning": RLSolver,
-        "genetic": GeneticSolver,
+    # Solver type -> (module, class name); modules are imported on first use
+    _solvers: Dict[str, Tuple[str, str]] = {
+        "csp": ("solvers.csp.csp_solver", "CSPSolver"),
+        "knowledge_based": ("solvers.knowledge_based.kb_solver", "KnowledgeBasedSolver"),
+        "bayesian": ("solvers.bayesian.bayesian_solver", "BayesianSolver"),
+        "reinforcement_learning": ("solvers.reinforcement_learning.rl_solver", "RLSolver"),
+        "genetic": ("solvers.genetic.genetic_solver", "GeneticSolver"),
+    }
+    _loaded: Dict[str, Type[BaseSolver]] = {}
+
+    _solver_info: Dict[str, str] = {
+        "csp": "Constraint Satisfaction Problem - Uses logical constraints and backtracking",
+        "knowledge_based": "Knowledge-Based System - Rule-based reasoning with letter frequency",
+        "bayesian": "Bayesian/Probabilistic - Information gain and entropy maximization",
+        "reinforcement_learning": "Reinforcement Learning - Learned policy from experience",
+        "genetic": "Genetic Algorithm - Evolutionary search with population-based optimization",
     }
 
     @classmethod
@@ -47,7 +53,11 @@ class SolverFactory:
                 f"Available: {list(cls._solvers.keys())}"
             )
 
-        solver_class = cls._solvers[solver_type]
+        solver_class = cls._loaded.get(solver_type)
+        if solver_class is None:
+            module_path, class_name = cls._solvers[solver_type]
+            solver_class = getattr(importlib.import_module(module_path), class_name)
+            cls._loaded[solver_type] = solver_class
         return solver_class(word_list, config)
 
     @classmethod
@@ -58,10 +68,5 @@ class SolverFactory:
     @classmethod
     def get_solver_info(cls) -> Dict[str, str]:
         """Get information about each solver."""
-        return {
-            "csp": "Constraint Satisfaction Problem - Uses logical constraints and backtracking",
-            "knowledge_based": "Knowledge-Based System - Rule-based reasoning with letter frequency",
-            "bayesian": "Bayesian/Probabilistic - Information gain and entropy maximization",
-            "reinforcement_learning": "Reinforcement Learning - Learned policy from experience",
-            "genetic": "Genetic Algorithm - Evolutionary search with population-based optimization",
-        }
+        # A copy, so callers editing the result cannot change it for everyone
+        return dict(cls._solver_info)
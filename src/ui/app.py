@@ -8,6 +8,7 @@ import os
 from pathlib import Path
 import logging
 import time
+import pandas as pd
 
 # Add src to path
 src_path = Path(__file__).parent.parent
@@ -37,8 +38,11 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-st.markdown(
-    """
+# Candidates each solver ranks per guess, as shown in the history
+TOP_CANDIDATES = 5
+
+# Styles and page header, rendered as one element on every run
+PAGE_HEADER_HTML = """
 <style>
     .main-header {
         font-size: 48px;
@@ -65,15 +69,35 @@ st.markdown(
         background-color: #5a9a54;
     }
 </style>
-""",
-    unsafe_allow_html=True,
-)
+<div class="main-header">🎮 AI Wordle Solver</div>
+<div class="sub-header">Multiple AI Algorithms Competing to Solve Wordle</div>
+"""
+
+
+@st.cache_resource
+def _load_word_list(valid_words_path: str, common_words_path: str) -> WordList:
+    """Load the word lists once per server process; shared read-only by all sessions."""
+    word_list = WordList(
+        valid_words_path=valid_words_path,
+        common_words_path=common_words_path,
+    )
+    # Load (or build and cache) the feedback pattern table up front so no
+    # session's first entropy-scored guess pays for it
+    cache_dir = Path(__file__).parent.parent.parent / "data" / "cache"
+    word_list.load_pattern_table(str(cache_dir))
+    return word_list
+
+
+@st.cache_resource
+def _load_config() -> ConfigLoader:
+    """Load the configuration once per server process."""
+    return ConfigLoader()
 
 
 def initialize_session_state():
     """Initialize Streamlit session state."""
     if "initialized" not in st.session_state:
-        config = ConfigLoader()
+        config = _load_config()
 
         # Get the base path for data files
         base_path = Path(__file__).parent.parent.parent
@@ -81,10 +105,7 @@ def initialize_session_state():
         common_words_path = base_path / "data" / "words" / "common_words.txt"
 
         # Initialize word list
-        word_list = WordList(
-            valid_words_path=str(valid_words_path),
-            common_words_path=str(common_words_path),
-        )
+        word_list = _load_word_list(str(valid_words_path), str(common_words_path))
 
         game = WordleGame(word_list, max_attempts=6)
 
@@ -97,6 +118,7 @@ def initialize_session_state():
         st.session_state.solver = None
         st.session_state.game_state = None
         st.session_state.auto_play = False
+        st.session_state.auto_play_steps = False
         # Store history of all guesses with their results
         st.session_state.guess_history = []
         st.session_state.initialized = True
@@ -104,24 +126,31 @@ def initialize_session_state():
 
 def start_new_game(solver_type: str, solver_config: dict, target_word: str = None):
     """Start a new game."""
-    solver = SolverFactory.create(
-        solver_type, st.session_state.word_list, solver_config
-    )
+    # Same solver and settings as last game: reset it instead of rebuilding
+    solver_key = (solver_type, tuple(sorted(solver_config.items())))
+    solver = st.session_state.solver
+    if solver is None or st.session_state.get("solver_key") != solver_key:
+        solver = SolverFactory.create(
+            solver_type,
+            st.session_state.word_list,
+            {**solver_config, "top_k": TOP_CANDIDATES},
+        )
+        st.session_state.solver_key = solver_key
     solver.reset()
 
     game_state = st.session_state.game.start_new_game(target_word)
 
     st.session_state.solver = solver
     st.session_state.game_state = game_state
-    st.session_state.start_time = time.time()
+    st.session_state.solver_time_ns = 0  # time spent inside the solver this game
     st.session_state.guess_history = []  # Reset history for new game
 
 
 def _fallback_guess():
     """Return a safe fallback guess (prefer common words, else any valid)."""
     wl = st.session_state.word_list
-    commons = list(wl.get_common_words() or [])
-    valids = list(wl.get_valid_words() or [])
+    commons = wl.get_common_words()
+    valids = wl.get_valid_words()
     if commons:
         return commons[0]
     if valids:
@@ -138,12 +167,14 @@ def make_solver_guess():
     if st.session_state.game_state.is_over:
         return
 
+    started = time.perf_counter_ns()
     try:
         guess = st.session_state.solver.get_next_guess()
     except Exception as ex:
         logger.exception("Solver.get_next_guess() raised an exception:")
         st.error("AI solver failed to produce a guess; using fallback.")
         guess = _fallback_guess()
+    st.session_state.solver_time_ns += time.perf_counter_ns() - started
 
     if guess is None or not isinstance(guess, str) or len(guess) == 0:
         logger.warning("Solver returned invalid guess: %r. Using fallback.", guess)
@@ -195,6 +226,7 @@ def make_solver_guess():
         solver_stats = st.session_state.solver.get_statistics()
 
         # Safely update solver state
+        started = time.perf_counter_ns()
         try:
             st.session_state.solver.update_state(guess, feedback)
         except Exception:
@@ -202,13 +234,15 @@ def make_solver_guess():
                 "solver.update_state raised an exception for guess %r", guess
             )
             # continue — we still want to update UI even if solver had an error
+        st.session_state.solver_time_ns += time.perf_counter_ns() - started
 
         # Store the result for UI display
         guess_result = {
             "attempt": st.session_state.game_state.attempts,
             "guess": guess,
             "feedback": feedback,
-            "remaining_words": len(st.session_state.solver.possible_words),
+            "remaining_words": st.session_state.solver.num_possible,
+            # Already limited to TOP_CANDIDATES by the solver
             "candidates": solver_stats.get("candidates", []),
             "selection_info": solver_stats.get("selection_info", {}),
         }
@@ -217,7 +251,8 @@ def make_solver_guess():
         # Check if game is over
 
         if st.session_state.game_state.is_over:
-            elapsed_time = time.time() - st.session_state.start_time
+            # Solver time only, excluding rendering and reruns between guesses
+            elapsed_time = st.session_state.solver_time_ns / 1e9
             st.session_state.metrics.add_game(
                 st.session_state.game_state.is_won,
                 st.session_state.game_state.attempts,
@@ -230,13 +265,7 @@ def main():
     """Main application."""
     initialize_session_state()
 
-    st.markdown(
-        '<div class="main-header">🎮 AI Wordle Solver</div>', unsafe_allow_html=True
-    )
-    st.markdown(
-        '<div class="sub-header">Multiple AI Algorithms Competing to Solve Wordle</div>',
-        unsafe_allow_html=True,
-    )
+    st.markdown(PAGE_HEADER_HTML, unsafe_allow_html=True)
 
     solver_type = render_solver_selector()
     solver_config = render_solver_settings(solver_type)
@@ -269,12 +298,20 @@ def main():
         with col_c:
             auto_play = st.checkbox("⚡ Auto Play", value=st.session_state.auto_play)
             st.session_state.auto_play = auto_play
+            st.session_state.auto_play_steps = st.checkbox(
+                "Show each step",
+                value=st.session_state.get("auto_play_steps", False),
+                help="Replay auto-play one guess per rerun instead of all at once",
+            )
 
         with st.expander("🎯 Custom Target Word"):
-            custom_word = st.text_input(
-                "Enter a 5-letter word (optional)", max_chars=5
-            ).lower()
-            if st.button("Start with Custom Word") and len(custom_word) == 5:
+            # A form only reruns the app on submit, not on every keystroke
+            with st.form("custom_word_form", clear_on_submit=True):
+                custom_word = st.text_input(
+                    "Enter a 5-letter word (optional)", max_chars=5
+                ).lower()
+                submitted = st.form_submit_button("Start with Custom Word")
+            if submitted and len(custom_word) == 5:
                 start_new_game(solver_type, solver_config, custom_word)
                 st.rerun()
 
@@ -315,34 +352,43 @@ def main():
             if st.session_state.guess_history:
                 st.subheader("📋 Guess History")
                 
-                for result in st.session_state.guess_history:
+                # One table for every attempt instead of an expander per attempt
+                history_df = pd.DataFrame(
+                    [
+                        {
+                            "Attempt": result["attempt"],
+                            "Guess": result["guess"].upper(),
+                            "Remaining": result["remaining_words"],
+                            "Algorithm": result.get("selection_info", {}).get("method", "N/A"),
+                            "Entropy": result.get("selection_info", {}).get("entropy"),
+                        }
+                        for result in st.session_state.guess_history
+                    ]
+                )
+                st.dataframe(history_df, use_container_width=True, hide_index=True)
+
+                # Top candidates only for the latest attempt
+                latest = st.session_state.guess_history[-1]
+                candidates = latest.get("candidates", [])
+                if candidates:
                     with st.expander(
-                        f"Attempt {result['attempt']}: {result['guess'].upper()} "
-                        f"({result['remaining_words']} words remaining)",
-                        expanded=(result['attempt'] == len(st.session_state.guess_history))
+                        f"Top Candidates Considered for {latest['guess'].upper()}",
+                        expanded=True,
                     ):
-                        col1, col2 = st.columns(2)
-                        
-                        with col1:
-                            st.write(f"**Guessed Word:** {result['guess'].upper()}")
-                            st.write(f"**Remaining Candidates:** {result['remaining_words']}")
-
-                        with col2:
-                            selection_info = result.get("selection_info", {})
-                            if selection_info:
-                                st.write(f"**Algorithm:** {selection_info.get('method', 'N/A')}")
-                                if "entropy" in selection_info:
-                                    st.write(f"**Entropy:** {selection_info.get('entropy', 'N/A')}")
-
-                        # Show top candidates
-                        candidates = result.get("candidates", [])
-                        if candidates:
-                            st.write("**Top Candidates Considered:**")
-                            for i, cand in enumerate(candidates, 1):
-                                st.write(
-                                    f"{i}. {cand.get('word', '').upper()} "
-                                    f"(Score: {cand.get('score', 'N/A')})"
-                                )
+                        st.dataframe(
+                            pd.DataFrame(
+                                [
+                                    {
+                                        "Rank": i,
+                                        "Word": cand.get("word", "").upper(),
+                                        "Score": cand.get("score", "N/A"),
+                                    }
+                                    for i, cand in enumerate(candidates, 1)
+                                ]
+                            ),
+                            use_container_width=True,
+                            hide_index=True,
+                        )
 
                 st.divider()
 
@@ -355,7 +401,7 @@ def main():
                     render_selection_progress(
                         st.session_state.game_state.guesses,
                         solver_stats.get("remaining_words", 0),
-                        len(st.session_state.word_list.get_common_words()),
+                        len(st.session_state.word_list.common_words),
                     )
 
                     st.divider()
@@ -371,14 +417,23 @@ def main():
             st.info("👆 Click 'New Game' to start!")
 
 
-    # Auto-play logic - store without rerun for speed
+    # Auto-play logic - play the rest of the game in this run and render once,
+    # unless the user asked to watch each guess
     if (
         st.session_state.auto_play
         and st.session_state.game_state
         and not st.session_state.game_state.is_over
     ):
-        time.sleep(0.5)
-        make_solver_guess()
+        if st.session_state.get("auto_play_steps", False):
+            time.sleep(0.5)
+            make_solver_guess()
+        else:
+            with st.spinner("AI playing..."):
+                while not st.session_state.game_state.is_over:
+                    attempts = st.session_state.game_state.attempts
+                    make_solver_guess()
+                    if st.session_state.game_state.attempts == attempts:
+                        break  # guess was rejected; avoid spinning forever
         st.rerun()
 
 
@@ -3,29 +3,64 @@ Dashboard component to compare two solvers across a set of words.
 
 Shows per-attempt candidate words with probabilities and tracks score progression.
 """
+from dataclasses import dataclass
 from typing import List, Dict, Any
 import streamlit as st
 from solvers.solver_factory import SolverFactory
 from core.game_engine import WordleGame
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
+import numpy as np
 
 
-def _simulate_solver_on_word_detailed(solver_type: str, word: str, word_list, max_attempts: int = 6) -> Dict[str, Any]:
+@dataclass
+class SimBatch:
+    """Simulation results for one solver, one row per target word.
+
+    Scores and words of the top candidate are stored per attempt; attempts
+    that were never played hold NaN / "".
+    """
+
+    top_scores: np.ndarray  # float32 [n_words, max_attempts]
+    top_words: np.ndarray  # <U5 [n_words, max_attempts]
+    won: np.ndarray  # bool [n_words]
+    attempts: np.ndarray  # int32 [n_words]
+    attempts_detail: List[List[Dict[str, Any]]]  # top-3 breakdown for display
+
+
+def _score_to_float(score: Any) -> float:
+    """Convert a candidate score (often a formatted string) to float; None is NaN."""
+    if score is None:
+        return float("nan")
+    try:
+        return float(score)
+    except (ValueError, TypeError):
+        return 0.0
+
+
+def _simulate_solver_on_word_detailed(solver_type: str, word: str, game: WordleGame) -> Dict[str, Any]:
     """Simulate a solver with detailed per-attempt tracking.
 
+    The game instance is reused across calls; a new game is started on it
+    for the given word.
+
     Returns a dict with:
     - attempts (int)
     - won (bool)
     - guesses (list of guess strings)
     - attempts_detail (list of dicts with per-attempt candidates and scores)
+    - top_scores / top_words (arrays indexed by attempt - 1)
     """
-    solver = SolverFactory.create(solver_type, word_list, config={})
+    word_list = game.word_list
+    max_attempts = game.max_attempts
+    solver = SolverFactory.create(solver_type, word_list, config={"top_k": 3})
     solver.reset()
 
-    game = WordleGame(word_list, max_attempts=max_attempts)
     game_state = game.start_new_game(word)
 
     attempts_detail = []
+    top_scores = np.full((max_attempts,), np.nan, dtype=np.float32)
+    top_words = np.full((max_attempts,), "", dtype="<U5")
     won = False
 
     # Loop until game over
@@ -36,8 +71,8 @@ def _simulate_solver_on_word_detailed(solver_type: str, word: str, word_list, ma
             guess = None
 
         if not guess or not isinstance(guess, str):
-            commons = list(word_list.get_common_words() or [])
-            guess = commons[0] if commons else list(word_list.get_valid_words() or ["raise"])[0]
+            commons = word_list.get_common_words()
+            guess = commons[0] if commons else (word_list.get_valid_words() or ("raise",))[0]
 
         guess = guess.lower()[:5]
 
@@ -45,32 +80,47 @@ def _simulate_solver_on_word_detailed(solver_type: str, word: str, word_list, ma
         if error:
             break
 
+        # Winning guess: no need to update the solver or score candidates.
+        # The score stays NaN, so score averages skip this attempt
+        if game_state.is_won:
+            attempts_detail.append({
+                "attempt": game_state.attempts,
+                "candidates": [{"word": guess, "score": None}],
+                "remaining_words": 1,
+            })
+            top_words[game_state.attempts - 1] = guess
+            won = True
+            break
+
         try:
             solver.update_state(guess, feedback)
         except Exception:
             pass
 
-        # Capture current candidates and scores AFTER update
-        stats = solver.get_statistics()
-        candidates = stats.get("candidates", [])
-        
-        # Extract top 3 candidates with scores
-        top_candidates = []
-        for cand in candidates[:3]:
-            if isinstance(cand, dict):
-                word_val = cand.get("word", "")
-                score_val = cand.get("score", 0)
-                top_candidates.append({"word": word_val, "score": score_val})
+        if solver.num_possible == 1:
+            # Only one word left, it is the top candidate by definition (unscored)
+            top_candidates = [{"word": next(iter(solver.possible_words)), "score": None}]
+        else:
+            # Capture current candidates and scores AFTER update
+            stats = solver.get_statistics()
+            candidates = stats.get("candidates", [])
+
+            # Extract top 3 candidates with scores
+            top_candidates = []
+            for cand in candidates:
+                if isinstance(cand, dict):
+                    word_val = cand.get("word", "")
+                    score_val = cand.get("score", 0)
+                    top_candidates.append({"word": word_val, "score": score_val})
 
         attempts_detail.append({
             "attempt": game_state.attempts,
             "candidates": top_candidates,
-            "remaining_words": len(solver.possible_words),
+            "remaining_words": solver.num_possible,
         })
-
-        if game_state.is_won:
-            won = True
-            break
+        if top_candidates:
+            top_scores[game_state.attempts - 1] = _score_to_float(top_candidates[0]["score"])
+            top_words[game_state.attempts - 1] = top_candidates[0]["word"]
 
         if game_state.attempts >= max_attempts:
             break
@@ -80,20 +130,38 @@ def _simulate_solver_on_word_detailed(solver_type: str, word: str, word_list, ma
         "won": won,
         "guesses": list(game_state.guesses),
         "attempts_detail": attempts_detail,
+        "top_scores": top_scores,
+        "top_words": top_words,
     }
 
 
-def _run_comparison_detailed(solver_a: str, solver_b: str, words: List[str], word_list) -> Dict[str, Any]:
+def _run_solver_batch(solver_type: str, words: List[str], game: WordleGame) -> SimBatch:
+    """Simulate one solver on every word and stack the results into a SimBatch."""
+    max_attempts = game.max_attempts
+    runs = [_simulate_solver_on_word_detailed(solver_type, w, game) for w in words]
+
+    return SimBatch(
+        top_scores=np.stack([r["top_scores"] for r in runs]) if runs else np.empty((0, max_attempts), dtype=np.float32),
+        top_words=np.stack([r["top_words"] for r in runs]) if runs else np.empty((0, max_attempts), dtype="<U5"),
+        won=np.array([r["won"] for r in runs], dtype=bool),
+        attempts=np.array([r["attempts"] for r in runs], dtype=np.int32),
+        attempts_detail=[r["attempts_detail"] for r in runs],
+    )
+
+
+def _run_comparison_detailed(solver_a: str, solver_b: str, words: List[str], word_list, max_attempts: int = 6) -> Dict[str, SimBatch]:
     """Run both solvers with detailed per-attempt tracking."""
-    results = {solver_a: [], solver_b: []}
+    game = WordleGame(word_list, max_attempts=max_attempts)
+    return {
+        solver_a: _run_solver_batch(solver_a, words, game),
+        solver_b: _run_solver_batch(solver_b, words, game),
+    }
 
-    for w in words:
-        a_res = _simulate_solver_on_word_detailed(solver_a, w, word_list)
-        b_res = _simulate_solver_on_word_detailed(solver_b, w, word_list)
-        results[solver_a].append({"word": w, **a_res})
-        results[solver_b].append({"word": w, **b_res})
 
-    return results
+def _average_top_scores(batch: SimBatch):
+    """Return (attempt numbers, mean top score) over the attempts that were played."""
+    played = np.flatnonzero(~np.isnan(batch.top_scores).all(axis=0))
+    return played + 1, np.nanmean(batch.top_scores[:, played], axis=0)
 
 
 def render_dashboard(
@@ -102,6 +170,7 @@ def render_dashboard(
     word_list,
     sample_size: int = 5,
     allow_controls: bool = True,
+    max_attempts: int = 6,
 ):
     """Render a detailed comparison dashboard.
 
@@ -135,7 +204,6 @@ def render_dashboard(
                 )
 
     # Prepare sample words
-    common_words = list(word_list.get_common_words() or [])
     sample_words = []
     
     if custom_words_input and isinstance(custom_words_input, str):
@@ -160,73 +228,31 @@ def render_dashboard(
         # Run detailed simulations
         with st.spinner("Running detailed comparison (this may take a minute)..."):
             if chosen_b:
-                results = _run_comparison_detailed(chosen_a, chosen_b, sample_words, word_list)
+                results = _run_comparison_detailed(chosen_a, chosen_b, sample_words, word_list, max_attempts)
             else:
-                results = {chosen_a: []}
-                for w in sample_words:
-                    a_res = _simulate_solver_on_word_detailed(chosen_a, w, word_list)
-                    results[chosen_a].append({"word": w, **a_res})
+                game = WordleGame(word_list, max_attempts=max_attempts)
+                results = {chosen_a: _run_solver_batch(chosen_a, sample_words, game)}
 
         # Display results word by word with side chart
         st.subheader("Per-Word Analysis")
 
-        # Prepare data for side chart (highest probability words per attempt)
-        highest_words_a = {}
-        highest_words_b = {} if chosen_b else None
+        batch_a = results[chosen_a]
+        batch_b = results[chosen_b] if chosen_b else None
 
         for word_idx, word in enumerate(sample_words):
             st.markdown(f"### Word {word_idx + 1}: **{word.upper()}**")
 
-            a_data = results[chosen_a][word_idx]
-            attempts_a = a_data.get("attempts_detail", [])
-            won_a = a_data.get("won", False)
+            attempts_a = batch_a.attempts_detail[word_idx]
+            won_a = bool(batch_a.won[word_idx])
 
             col_chart, col_text = st.columns([1, 2])
 
-            # Collect highest words for this word across attempts for side chart
-            for attempt_info in attempts_a:
-                att_num = attempt_info.get("attempt", 0)
-                candidates = attempt_info.get("candidates", [])
-                if candidates:
-                    top_word = candidates[0].get("word", "")
-                    top_score = candidates[0].get("score", 0)
-                    # Convert to float if string
-                    if isinstance(top_score, str):
-                        try:
-                            top_score = float(top_score)
-                        except (ValueError, TypeError):
-                            top_score = 0
-                    if att_num not in highest_words_a:
-                        highest_words_a[att_num] = []
-                    highest_words_a[att_num].append((top_word, top_score))
-
-            if chosen_b:
-                b_data = results[chosen_b][word_idx]
-                attempts_b = b_data.get("attempts_detail", [])
-                won_b = b_data.get("won", False)
-
-                for attempt_info in attempts_b:
-                    att_num = attempt_info.get("attempt", 0)
-                    candidates = attempt_info.get("candidates", [])
-                    if candidates:
-                        top_word = candidates[0].get("word", "")
-                        top_score = candidates[0].get("score", 0)
-                        # Convert to float if string
-                        if isinstance(top_score, str):
-                            try:
-                                top_score = float(top_score)
-                            except (ValueError, TypeError):
-                                top_score = 0
-                        if att_num not in highest_words_b:
-                            highest_words_b[att_num] = []
-                        highest_words_b[att_num].append((top_word, top_score))
-
             # Text details: per-attempt breakdown
             with col_text:
                 col_a, col_b_text = st.columns(2 if chosen_b else [1, 0.001])
 
                 with col_a:
-                    st.write(f"**{chosen_a}** — {'✅ Won' if won_a else '❌ Failed'} in {a_data.get('attempts', 0)} attempts")
+                    st.write(f"**{chosen_a}** — {'✅ Won' if won_a else '❌ Failed'} in {batch_a.attempts[word_idx]} attempts")
                     
                     for attempt_info in attempts_a:
                         att_num = attempt_info.get("attempt", 0)
@@ -235,16 +261,15 @@ def render_dashboard(
                         for i, cand in enumerate(candidates, 1):
                             word_c = cand.get("word", "?")
                             score_c = cand.get("score", 0)
-                            score_str = f"{score_c:.3f}" if isinstance(score_c, float) else str(score_c)
+                            score_str = "not scored" if score_c is None else f"{score_c:.3f}" if isinstance(score_c, float) else str(score_c)
                             st.write(f"    {i}. **{word_c.upper()}** ({score_str})")
 
                 if chosen_b:
                     with col_b_text:
-                        b_data = results[chosen_b][word_idx]
-                        attempts_b = b_data.get("attempts_detail", [])
-                        won_b = b_data.get("won", False)
+                        attempts_b = batch_b.attempts_detail[word_idx]
+                        won_b = bool(batch_b.won[word_idx])
 
-                        st.write(f"**{chosen_b}** — {'✅ Won' if won_b else '❌ Failed'} in {b_data.get('attempts', 0)} attempts")
+                        st.write(f"**{chosen_b}** — {'✅ Won' if won_b else '❌ Failed'} in {batch_b.attempts[word_idx]} attempts")
                         
                         for attempt_info in attempts_b:
                             att_num = attempt_info.get("attempt", 0)
@@ -253,7 +278,7 @@ def render_dashboard(
                             for i, cand in enumerate(candidates, 1):
                                 word_c = cand.get("word", "?")
                                 score_c = cand.get("score", 0)
-                                score_str = f"{score_c:.3f}" if isinstance(score_c, float) else str(score_c)
+                                score_str = "not scored" if score_c is None else f"{score_c:.3f}" if isinstance(score_c, float) else str(score_c)
                                 st.write(f"    {i}. **{word_c.upper()}** ({score_str})")
 
             st.divider()
@@ -261,68 +286,44 @@ def render_dashboard(
         # Side chart: Highest probability words connecting across attempts
         st.subheader("Highest Probability Word Progression")
 
-        chart_col_a, chart_col_b = st.columns(2 if chosen_b else [1, 0.001])
+        subplot_titles = [
+            f"{name} — Highest Probability per Attempt"
+            for name in ([chosen_a, chosen_b] if chosen_b else [chosen_a])
+        ]
+        fig = make_subplots(rows=1, cols=len(subplot_titles), subplot_titles=subplot_titles)
 
         # Chart for Algorithm 1 - highest probability words
-        with chart_col_a:
-            fig_a = go.Figure()
-            attempts_sorted = sorted(highest_words_a.keys())
-            avg_scores_a = []
-            
-            for att in attempts_sorted:
-                scores = [score for word, score in highest_words_a[att]]
-                avg_score = sum(scores) / len(scores) if scores else 0
-                avg_scores_a.append(avg_score)
-            
-            fig_a.add_trace(go.Scatter(
-                x=attempts_sorted,
-                y=avg_scores_a,
-                mode="lines+markers",
-                name=f"{chosen_a} Top Word",
-                line=dict(color="#6aaa64", width=3),
-                marker=dict(size=10),
-                text=[f"Attempt {att}" for att in attempts_sorted],
-                hovertemplate="<b>%{text}</b><br>Avg Score: %{y:.3f}<extra></extra>"
-            ))
-            
-            fig_a.update_layout(
-                title=f"{chosen_a} — Highest Probability per Attempt",
-                xaxis_title="Attempt",
-                yaxis_title="Score",
-                height=350,
-                margin=dict(t=50, l=50, r=20, b=50),
-            )
-            st.plotly_chart(fig_a, use_container_width=True)
+        attempts_sorted, avg_scores_a = _average_top_scores(batch_a)
+        fig.add_trace(go.Scatter(
+            x=attempts_sorted,
+            y=avg_scores_a,
+            mode="lines+markers",
+            name=f"{chosen_a} Top Word",
+            line=dict(color="#6aaa64", width=3),
+            marker=dict(size=10),
+            text=[f"Attempt {att}" for att in attempts_sorted],
+            hovertemplate="<b>%{text}</b><br>Avg Score: %{y:.3f}<extra></extra>"
+        ), row=1, col=1)
 
         # Chart for Algorithm 2 (if selected)
         if chosen_b:
-            with chart_col_b:
-                fig_b = go.Figure()
-                attempts_sorted_b = sorted(highest_words_b.keys())
-                avg_scores_b = []
-                
-                for att in attempts_sorted_b:
-                    scores = [score for word, score in highest_words_b[att]]
-                    avg_score = sum(scores) / len(scores) if scores else 0
-                    avg_scores_b.append(avg_score)
-                
-                fig_b.add_trace(go.Scatter(
-                    x=attempts_sorted_b,
-                    y=avg_scores_b,
-                    mode="lines+markers",
-                    name=f"{chosen_b} Top Word",
-                    line=dict(color="#f4c542", width=3),
-                    marker=dict(size=10),
-                    text=[f"Attempt {att}" for att in attempts_sorted_b],
-                    hovertemplate="<b>%{text}</b><br>Avg Score: %{y:.3f}<extra></extra>"
-                ))
-                
-                fig_b.update_layout(
-                    title=f"{chosen_b} — Highest Probability per Attempt",
-                    xaxis_title="Attempt",
-                    yaxis_title="Score",
-                    height=350,
-                    margin=dict(t=50, l=50, r=20, b=50),
-                )
-                st.plotly_chart(fig_b, use_container_width=True)
-
+            attempts_sorted_b, avg_scores_b = _average_top_scores(batch_b)
+            fig.add_trace(go.Scatter(
+                x=attempts_sorted_b,
+                y=avg_scores_b,
+                mode="lines+markers",
+                name=f"{chosen_b} Top Word",
+                line=dict(color="#f4c542", width=3),
+                marker=dict(size=10),
+                text=[f"Attempt {att}" for att in attempts_sorted_b],
+                hovertemplate="<b>%{text}</b><br>Avg Score: %{y:.3f}<extra></extra>"
+            ), row=1, col=2)
+
+        fig.update_xaxes(title_text="Attempt")
+        fig.update_yaxes(title_text="Score")
+        fig.update_layout(
+            height=350,
+            showlegend=False,
+            margin=dict(t=50, l=50, r=20, b=50),
+        )
+        st.plotly_chart(fig, use_container_width=True)
@@ -3,6 +3,7 @@ Wordle game board component.
 """
 
 import streamlit as st
+from functools import lru_cache
 from typing import List, Tuple
 from core.feedback import Feedback, LetterStatus
 
@@ -104,19 +105,6 @@ def render_keyboard(guesses: List[str], feedbacks: List[Feedback]):
         feedbacks: List of feedback for each guess
     """
 
-    # Track letter status
-    letter_status = {}
-
-    for guess, feedback in zip(guesses, feedbacks):
-        for letter, status in zip(guess, feedback.feedback):
-            # Keep best status for each letter
-            current = letter_status.get(letter, LetterStatus.ABSENT)
-            if status.value > current.value:
-                letter_status[letter] = status
-
-    # Keyboard layout
-    rows = ["QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM"]
-
     st.markdown(
         """
     <style>
@@ -162,6 +150,40 @@ def render_keyboard(guesses: List[str], feedbacks: List[Feedback]):
         unsafe_allow_html=True,
     )
 
+    # Same guesses render the same keys; skip rebuilding on cosmetic reruns
+    html = _keyboard_html(
+        tuple(guesses), tuple(tuple(feedback.feedback) for feedback in feedbacks)
+    )
+    st.markdown(html, unsafe_allow_html=True)
+
+
+@lru_cache(maxsize=64)
+def _keyboard_html(
+    guesses: Tuple[str, ...], statuses: Tuple[Tuple[LetterStatus, ...], ...]
+) -> str:
+    """
+    Build the keyboard markup for a game position.
+
+    Args:
+        guesses: Guesses made so far
+        statuses: Letter statuses of each guess
+
+    Returns:
+        HTML for the keyboard rows
+    """
+    # Track letter status
+    letter_status = {}
+
+    for guess, feedback in zip(guesses, statuses):
+        for letter, status in zip(guess, feedback):
+            # Keep best status for each letter
+            current = letter_status.get(letter, LetterStatus.ABSENT)
+            if status.value > current.value:
+                letter_status[letter] = status
+
+    # Keyboard layout
+    rows = ["QWERTYUIOP", "ASDFGHJKL", "ZXCVBNM"]
+
     html = '<div class="keyboard">'
 
     for row in rows:
@@ -181,5 +203,4 @@ def render_keyboard(guesses: List[str], feedbacks: List[Feedback]):
         html += "</div>"
 
     html += "</div>"
-
-    st.markdown(html, unsafe_allow_html=True)
+    return html
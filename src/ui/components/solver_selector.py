@@ -5,6 +5,21 @@ Solver selection component.
 import streamlit as st
 from solvers.solver_factory import SolverFactory
 
+# Display name -> solver type
+SOLVER_OPTIONS = {
+    "CSP": "csp",
+    "Knowledge-Based": "knowledge_based",
+    "Bayesian": "bayesian",
+    "Reinforcement Learning": "reinforcement_learning",
+    "Genetic Algorithm": "genetic",
+}
+
+
+@st.cache_data
+def _cached_solver_info() -> dict:
+    """Solver descriptions, fetched once per process."""
+    return SolverFactory.get_solver_info()
+
 
 def render_solver_selector() -> str:
     """
@@ -15,24 +30,15 @@ def render_solver_selector() -> str:
     """
     st.sidebar.header("🤖 AI Solver Selection")
 
-    solver_info = SolverFactory.get_solver_info()
-
-    # Create options with descriptions
-    solver_options = {
-        "CSP": "csp",
-        "Knowledge-Based": "knowledge_based",
-        "Bayesian": "bayesian",
-        "Reinforcement Learning": "reinforcement_learning",
-        "Genetic Algorithm": "genetic",
-    }
+    solver_info = _cached_solver_info()
 
     selected_display = st.sidebar.selectbox(
         "Choose AI Algorithm",
-        options=list(solver_options.keys()),
+        options=list(SOLVER_OPTIONS.keys()),
         help="Select which AI algorithm to use for solving",
     )
 
-    selected_solver = solver_options[selected_display]
+    selected_solver = SOLVER_OPTIONS[selected_display]
 
     # Show description
     with st.sidebar.expander("ℹ️ Algorithm Description"):
@@ -75,7 +81,13 @@ def render_solver_settings(solver_type: str) -> dict:
             step=0.05,
             help="Probability of random exploration",
         )
+        keep_preferences = st.sidebar.checkbox(
+            "Keep Learned Preferences",
+            value=False,
+            help="Carry letter position preferences over to the next game",
+        )
         config["epsilon"] = epsilon
+        config["keep_preferences"] = keep_preferences
 
     elif solver_type == "genetic":
         population_size = st.sidebar.slider(
@@ -15,6 +15,8 @@ class PerformanceMetrics:
         self.games_won = 0
         self.guess_counts = []
         self.solve_times = []
+        # Summary of the games so far, rebuilt only after a change
+        self._summary = None
 
     def add_game(self, won: bool, guesses: int, time_taken: float = 0):
         """
@@ -31,6 +33,7 @@ class PerformanceMetrics:
         self.guess_counts.append(guesses)
         if time_taken > 0:
             self.solve_times.append(time_taken)
+        self._summary = None
 
     def get_win_rate(self) -> float:
         """Get win rate percentage."""
@@ -58,15 +61,20 @@ class PerformanceMetrics:
         return distribution
 
     def get_summary(self) -> Dict:
-        """Get summary statistics."""
-        return {
-            "games_played": self.games_played,
-            "games_won": self.games_won,
-            "win_rate": self.get_win_rate(),
-            "average_guesses": self.get_average_guesses(),
-            "average_time": self.get_average_time(),
-            "guess_distribution": self.get_guess_distribution(),
-        }
+        """Get summary statistics, cached until the next game is added."""
+        if self._summary is None:
+            self._summary = {
+                "games_played": self.games_played,
+                "games_won": self.games_won,
+                "win_rate": self.get_win_rate(),
+                "average_guesses": self.get_average_guesses(),
+                "average_time": self.get_average_time(),
+                "guess_distribution": self.get_guess_distribution(),
+            }
+        # Copies, so callers editing the result cannot corrupt the cache
+        summary = dict(self._summary)
+        summary["guess_distribution"] = dict(summary["guess_distribution"])
+        return summary
 
     def reset(self):
         """Reset all metrics."""
@@ -74,3 +82,4 @@ class PerformanceMetrics:
         self.games_won = 0
         self.guess_counts = []
         self.solve_times = []
+        self._summary = None
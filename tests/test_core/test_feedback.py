@@ -0,0 +1,45 @@
+"""
+Tests for feedback generation.
+"""
+
+import pytest
+from src.core.feedback import Feedback, LetterStatus, encode_words, pattern_id, pattern_ids
+from src.core.word_list import WordList
+
+
+@pytest.fixture(scope="session")
+def word_list():
+    """Create a test word list."""
+    return WordList("data/words/valid_words.txt", "data/words/common_words.txt")
+
+
+def test_feedback_repeated_letters():
+    """Test that repeated guess letters are only marked while available."""
+    feedback = Feedback("speed", "abide")
+
+    assert feedback.feedback == [
+        LetterStatus.ABSENT,
+        LetterStatus.ABSENT,
+        LetterStatus.PRESENT,
+        LetterStatus.ABSENT,
+        LetterStatus.PRESENT,
+    ]
+
+
+def test_pattern_id_encoding():
+    """Test base-3 encoding of feedback."""
+    assert Feedback("slate", "slate").to_pattern_id() == 242
+    assert Feedback("fjord", "slate").to_pattern_id() == 0
+    assert Feedback("tales", "slate").to_pattern_id() == 1 + 3 + 9 + 27 + 81
+
+
+@pytest.mark.parametrize("guess", ["slate", "speed", "eerie", "mamma", "array"])
+def test_pattern_ids_match_feedback(word_list, guess):
+    """Test vectorized patterns agree with Feedback for every answer."""
+    answers = word_list.get_common_words()
+    ids = pattern_ids(guess, encode_words(answers))
+
+    expected = [Feedback(guess, a).to_pattern_id() for a in answers]
+
+    assert ids.tolist() == expected
+    assert [pattern_id(guess, a) for a in answers] == expected
@@ -7,7 +7,7 @@ from src.core.game_engine import WordleGame, GameState
 from src.core.word_list import WordList
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def word_list():
     """Create a test word list."""
     return WordList("data/words/valid_words.txt", "data/words/common_words.txt")
@@ -36,39 +36,58 @@ def test_start_new_game(game):
     assert not game_state.is_over
 
 
-def test_valid_guess(game):
-    """Test making a valid guess."""
-    game.start_new_game("slate")
-    success, feedback, error = game.make_guess("crane")
-
-    assert success
-    assert feedback is not None
-    assert error == ""
-
-
-def test_invalid_guess_length(game):
-    """Test guess with wrong length."""
-    game.start_new_game("slate")
-    success, feedback, error = game.make_guess("cat")
-
-    assert not success
-    assert feedback is None
-    assert error != ""
+def test_start_new_game_resets_state(game):
+    """Test that a new game reuses and resets the previous state."""
+    first = game.start_new_game("slate")
+    game.make_guess("slate")
+    second = game.start_new_game("crane")
+
+    assert second is first
+    assert second.target_word == "crane"
+    assert second.attempts == 0
+    assert second.guesses == []
+    assert not second.is_won
+    assert not second.is_over
+
+
+@pytest.mark.parametrize(
+    "target,guess,expected_success,expected_won",
+    [
+        ("slate", "crane", True, False),  # valid guess
+        ("slate", "cat", False, False),  # wrong length
+        ("slate", "slate", True, True),  # winning guess
+    ],
+)
+def test_make_guess(game, target, guess, expected_success, expected_won):
+    """Test making guesses against a target word."""
+    game.start_new_game(target)
+    success, feedback, error = game.make_guess(guess)
+
+    assert success == expected_success
+    if expected_success:
+        assert feedback is not None
+        assert error == ""
+        assert feedback.is_correct() == expected_won
+    else:
+        assert feedback is None
+        assert error != ""
+
+    assert game.current_game.is_won == expected_won
+    assert game.current_game.is_over == expected_won
 
 
-def test_winning_game(game):
-    """Test winning a game."""
+def test_losing_game(game):
+    """Test losing a game."""
     game.start_new_game("slate")
-    success, feedback, error = game.make_guess("slate")
+    game._testing_exhaust()
 
-    assert success
-    assert feedback.is_correct()
-    assert game.current_game.is_won
+    assert not game.current_game.is_won
     assert game.current_game.is_over
 
 
-def test_losing_game(game):
-    """Test losing a game."""
+@pytest.mark.slow
+def test_losing_game_played_out(game):
+    """Test losing a game by making six wrong guesses."""
     game.start_new_game("slate")
 
     # Make 6 wrong guesses
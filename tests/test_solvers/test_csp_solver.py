@@ -8,7 +8,7 @@ from src.core.word_list import WordList
 from src.core.feedback import Feedback
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def word_list():
     """Create a test word list."""
     return WordList("data/words/valid_words.txt", "data/words/common_words.txt")
@@ -43,6 +43,7 @@ def test_update_state(solver):
 
     # Number of possible words should decrease
     assert len(solver.possible_words) < initial_words
+    assert solver.num_possible == len(solver.possible_words)
 
 
 def test_reset(solver):
@@ -57,3 +58,64 @@ def test_reset(solver):
 
     assert len(solver.guess_history) == 0
     assert len(solver.feedback_history) == 0
+    assert solver.possible_words == set(solver.word_list.get_common_words())
+
+
+def test_constraints_match_feedback(word_list):
+    """Test that constraint filtering keeps every word consistent with feedback."""
+    from src.solvers.csp import constraints as csp_constraints
+
+    # Build feedback with the class the constraints module compares against
+    constraints = csp_constraints.ConstraintSet()
+    for guess in ["slate", "crony"]:
+        constraints.add_from_feedback(guess, csp_constraints.Feedback(guess, "count"))
+
+    survivors = [w for w in word_list.get_common_words() if constraints.is_satisfied(w)]
+
+    assert "count" in survivors
+    assert "slate" not in survivors
+
+
+def test_regex_filter_matches_is_satisfied(word_list):
+    """Test that the compiled regex agrees with per-word constraint checks."""
+    from src.solvers.csp import constraints as csp_constraints
+
+    constraints = csp_constraints.ConstraintSet()
+    for guess in ["speed", "eerie"]:
+        constraints.add_from_feedback(guess, csp_constraints.Feedback(guess, "abide"))
+
+    words = word_list.get_common_words()
+
+    assert constraints.filter(words) == [w for w in words if constraints.is_satisfied(w)]
+
+
+def test_constraints_are_deduplicated():
+    """Test that repeated feedback does not grow the constraint set."""
+    from src.solvers.csp import constraints as csp_constraints
+
+    constraints = csp_constraints.ConstraintSet()
+    feedback = csp_constraints.Feedback("slate", "stale")
+    constraints.add_from_feedback("slate", feedback)
+    count = constraints.constraint_count()
+    constraints.add_from_feedback("slate", feedback)
+
+    assert constraints.constraint_count() == count
+
+
+def test_top_indices_match_stable_sort():
+    """Test that the top-k selection matches a stable descending sort."""
+    import numpy as np
+
+    scores = np.array([3.0, 5.0, 1.0, 5.0, 3.0, 3.0, 0.0, 5.0])
+    expected = np.argsort(-scores, kind="stable")[:5]
+
+    assert CSPSolver._top_indices(scores).tolist() == expected.tolist()
+
+
+def test_top_k_limits_candidates(word_list):
+    """Test that the solver ranks only top_k candidates."""
+    solver = CSPSolver(word_list, {"top_k": 2})
+    solver.update_state("slate", Feedback("slate", "crane"))
+    solver.get_next_guess()
+
+    assert len(solver.candidates) == 2
@@ -0,0 +1,32 @@
+"""
+Tests for reinforcement learning solver.
+"""
+
+import numpy as np
+import pytest
+from src.solvers.reinforcement_learning.rl_solver import RLSolver
+from src.core.word_list import WordList
+
+
+@pytest.fixture(scope="session")
+def word_list():
+    """Create a test word list."""
+    return WordList("data/words/valid_words.txt", "data/words/common_words.txt")
+
+
+def test_reset_keeps_preferences_by_default(word_list):
+    """Test that learned preferences survive reset."""
+    solver = RLSolver(word_list)
+    solver.position_preferences[0] = 1 / 26
+    learned = solver.position_preferences.copy()
+    solver.reset()
+    assert np.array_equal(solver.position_preferences, learned)
+
+
+def test_reset_can_forget_preferences(word_list):
+    """Test that reset restores initial preferences when configured to."""
+    solver = RLSolver(word_list, {"keep_preferences": False})
+    initial = solver.position_preferences.copy()
+    solver.position_preferences[0] = 1 / 26
+    solver.reset()
+    assert np.array_equal(solver.position_preferences, initial)